@@ -1,13 +1,15 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import anthropic
-from app.config import settings
+from app.config import get_anthropic_client, settings
 from pydantic import BaseModel, Field
 from app.tools.base_tool import BaseTool
 from app.tools.registry import register_tools
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, List
 # from .base_agent import Agent  # Importing your base Agent class
 from app.tools.web_search import WebSearchTool
 from app.tools.web_scraper import WebScraperTool
@@ -17,6 +19,28 @@ from app.tools.plonkit_search.plonkit_search import PlonkitSearchTool
 from app.tools.maindb_tool import MainDBTool
 
 
+# Worker threads for tool calls made in the same turn, shared by all detectives
+TOOL_MAX_WORKERS = 8
+_TOOL_POOL = ThreadPoolExecutor(max_workers=TOOL_MAX_WORKERS, thread_name_prefix="detective-tool")
+
+# Tools that read and write the shared investigation state; never run concurrently
+INLINE_TOOLS = {"maindb"}
+
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy of messages with a prompt cache breakpoint on the last content block.
+
+    Only the newest message is marked, so the conversation never exceeds the API's
+    limit of four breakpoints while each turn reads the previous turn's prefix.
+    """
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    content = [*content[:-1], {**content[-1], "cache_control": EPHEMERAL_CACHE}]
+    return [*messages[:-1], {**last, "content": content}]
 
 
 class AgentMessage(BaseModel):
@@ -46,6 +70,7 @@ class Agent:
         tools: list[BaseTool] | None = None,
         model: str | None = None,
         system_prompt: str | None = None,
+        client: anthropic.Anthropic | None = None,
     ):
         """
         Initialize the agent with tools and configuration.
@@ -54,8 +79,10 @@ class Agent:
             tools: List of tool instances the agent can use
             model: Claude model identifier (defaults to settings.default_model)
             system_prompt: Custom system instructions for the agent
+            client: Shared Anthropic client, so agents reuse one connection pool
+                (a new client is created if omitted)
         """
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = client or get_anthropic_client()
         self.model = model or settings.default_model
         self.conversation_history: list[AgentMessage] = []
 
@@ -74,7 +101,7 @@ class Detective(Agent):
     Executes structured investigation plans from the PlannerAgent.
     """
 
-    def __init__(self, db=None, tools=None, model=None):
+    def __init__(self, db=None, tools=None, model=None, client=None):
 
         if model is None:
             model = settings.default_model
@@ -172,9 +199,14 @@ class Detective(Agent):
 
         REMEMBER: You are working within a fixed iteration budget. Use it efficiently to gather maximum information.
         """
-        super().__init__(tools=tools, model=model, system_prompt=system_prompt)
+        super().__init__(tools=tools, model=model, system_prompt=system_prompt, client=client)
 
-    def investigate_with_plan(self, plan: Dict[str, Any], max_iterations: int = 20) -> Dict[str, Any]:
+    def investigate_with_plan(
+        self,
+        plan: Dict[str, Any],
+        max_iterations: int = 20,
+        on_iteration: Callable[[dict[str, Any]], None] | None = None,
+    ) -> Dict[str, Any]:
         """
         Execute an investigation based on a structured plan from PlannerAgent.
 
@@ -185,6 +217,9 @@ class Detective(Agent):
         Args:
             plan: Dict with "state" (investigation context) and "next_steps" (action list).
             max_iterations: Maximum number of agentic turns per pipeline cycle (default: 20).
+            on_iteration: Optional callback invoked with each iteration's log entry as soon
+                as the iteration finishes, so callers can report progress before the
+                whole run returns. Called from the thread running the investigation.
 
         Returns:
             Dict with execution logs for each iteration:
@@ -250,14 +285,39 @@ Begin executing this investigation plan. Start by accessing the maindb tool to r
                 iteration += 1
                 print(f"\n=== ITERATION {iteration} ===")
 
-                # Create message to Claude
-                response = self.client.messages.create(
+                # Stream the response so each network-bound tool call starts as soon
+                # as its input is complete, while the model is still decoding the rest
+                dispatched = {}
+                print("Agent reasoning:")
+                # Tools, system prompt and history are resent verbatim every turn;
+                # cache breakpoints let the API reuse them instead of prefilling again
+                with self.client.messages.stream(
                     model=self.model,
                     max_tokens=4096,
-                    system=self.system_prompt,
-                    messages=messages,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": self.system_prompt,
+                            "cache_control": EPHEMERAL_CACHE,
+                        }
+                    ],
+                    messages=_with_cache_breakpoint(messages),
                     tools=self.tool_schemas
-                )
+                ) as stream:
+                    for event in stream:
+                        # Show the reasoning as it is generated rather than after the turn
+                        if event.type == "text":
+                            print(event.text, end="", flush=True)
+                        elif (
+                            event.type == "content_block_stop"
+                            and event.content_block.type == "tool_use"
+                            and event.content_block.name not in INLINE_TOOLS
+                        ):
+                            dispatched[event.content_block.id] = _TOOL_POOL.submit(
+                                self._execute_tool_call, event.content_block
+                            )
+                    response = stream.get_final_message()
+                print()
 
                 # Extract reasoning from text content blocks
                 agent_reasoning = ""
@@ -265,8 +325,6 @@ Begin executing this investigation plan. Start by accessing the maindb tool to r
                     if block.type == "text":
                         agent_reasoning += block.text
 
-                print(f"Agent reasoning:\n{agent_reasoning[:500]}...")
-
                 # Log this iteration
                 iteration_log = {
                     "iteration": iteration,
@@ -283,14 +341,14 @@ Begin executing this investigation plan. Start by accessing the maindb tool to r
                     print("No tool calls in response. Investigation complete.")
                     final_response = agent_reasoning
                     execution_log.append(iteration_log)
+                    if on_iteration is not None:
+                        on_iteration(iteration_log)
                     break
 
                 # Execute each tool call
-                tool_results = []
                 for tool_block in tool_use_blocks:
                     tool_name = tool_block.name
                     tool_input = tool_block.input
-                    tool_id = tool_block.id
 
                     print(f"Executing tool: {tool_name}")
                     print(f"Input: {json.dumps(tool_input, indent=2)}")
@@ -307,64 +365,30 @@ Begin executing this investigation plan. Start by accessing the maindb tool to r
                         else:
                             tool_call_history.append(search_signature)
 
-                    tool_call_log = {
-                        "tool_name": tool_name,
-                        "input": tool_input,
-                        "result": None,
-                        "success": False,
-                        "error": None
-                    }
-
-                    # Execute the tool
-                    try:
-                        if tool_name in self.tool_map:
-                            tool = self.tool_map[tool_name]
-                            result = tool.execute(**tool_input)
-
-                            # Handle ToolResult objects
-                            if hasattr(result, 'success'):
-                                tool_call_log["success"] = result.success
-                                tool_call_log["result"] = result.data
-                                tool_call_log["error"] = result.error
-                                result_content = json.dumps(result.data) if result.data else str(result.error)
-                            else:
-                                tool_call_log["success"] = True
-                                tool_call_log["result"] = result
-                                result_content = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
-
-                            print(f"Result: {result_content[:300]}...")
-
-                            # Add tool result to messages
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": result_content
-                            })
-                        else:
-                            error_msg = f"Tool '{tool_name}' not found in tool_map"
-                            tool_call_log["error"] = error_msg
-                            print(f"ERROR: {error_msg}")
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": error_msg,
-                                "is_error": True
-                            })
-
-                    except Exception as e:
-                        error_msg = f"Error executing {tool_name}: {str(e)}"
-                        tool_call_log["error"] = error_msg
-                        print(f"ERROR: {error_msg}")
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_id,
-                            "content": error_msg,
-                            "is_error": True
-                        })
-
+                # Calls within one turn are independent, so network-bound tools run
+                # concurrently (most were already dispatched while streaming); calls
+                # touching the investigation database run here, in order
+                futures = [
+                    None if tool_block.name in INLINE_TOOLS
+                    else dispatched.get(tool_block.id)
+                    or _TOOL_POOL.submit(self._execute_tool_call, tool_block)
+                    for tool_block in tool_use_blocks
+                ]
+                outcomes = [
+                    self._execute_tool_call(tool_block) if future is None else None
+                    for tool_block, future in zip(tool_use_blocks, futures)
+                ]
+
+                # Results go back in the order the model requested them
+                tool_results = []
+                for outcome, future in zip(outcomes, futures):
+                    tool_call_log, tool_result = outcome or future.result()
+                    tool_results.append(tool_result)
                     iteration_log["tool_calls"].append(tool_call_log)
 
                 execution_log.append(iteration_log)
+                if on_iteration is not None:
+                    on_iteration(iteration_log)
 
                 # Add assistant response and tool results to conversation
                 messages.append({"role": "assistant", "content": response.content})
@@ -405,4 +429,81 @@ Begin executing this investigation plan. Start by accessing the maindb tool to r
                 "execution_log": execution_log,
                 "final_response": final_response,
                 "error": error_msg
+            }
+
+
+    def _execute_tool_call(self, tool_block) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run one tool_use block.
+
+        Returns:
+            Tuple of (tool call log entry, tool_result content block for the API).
+        """
+        tool_name = tool_block.name
+        tool_input = tool_block.input
+        tool_id = tool_block.id
+
+        tool_call_log = {
+            "tool_name": tool_name,
+            "input": tool_input,
+            "result": None,
+            "success": False,
+            "error": None
+        }
+
+        # Execute the tool
+        try:
+            if tool_name in self.tool_map:
+                tool = self.tool_map[tool_name]
+                result = tool.execute(**tool_input)
+
+                # Handle ToolResult objects
+                if hasattr(result, 'success'):
+                    tool_call_log["success"] = result.success
+                    tool_call_log["result"] = result.data
+                    tool_call_log["error"] = result.error
+                    if "fuzzy_match_of" in result.metadata:
+                        tool_call_log["fuzzy_match_of"] = result.metadata["fuzzy_match_of"]
+                    if not result.data:
+                        result_content = str(result.error)
+                    elif isinstance(result.data, str):
+                        # Text results are passed through, not wrapped in JSON quotes
+                        result_content = result.data
+                    else:
+                        result_content = json.dumps(result.data)
+                else:
+                    tool_call_log["success"] = True
+                    tool_call_log["result"] = result
+                    if isinstance(result, (dict, list)):
+                        result_content = json.dumps(result)
+                    else:
+                        result_content = str(result)
+
+                print(f"Result: {result_content[:300]}...")
+
+                # Add tool result to messages
+                return tool_call_log, {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": result_content
+                }
+            else:
+                error_msg = f"Tool '{tool_name}' not found in tool_map"
+                tool_call_log["error"] = error_msg
+                print(f"ERROR: {error_msg}")
+                return tool_call_log, {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": error_msg,
+                    "is_error": True
+                }
+
+        except Exception as e:
+            error_msg = f"Error executing {tool_name}: {str(e)}"
+            tool_call_log["error"] = error_msg
+            print(f"ERROR: {error_msg}")
+            return tool_call_log, {
+                "type": "tool_result",
+                "tool_use_id": tool_id,
+                "content": error_msg,
+                "is_error": True
             }
\ No newline at end of file
@@ -2,6 +2,7 @@
 import logging
 from typing import Any, Dict
 from anthropic import Anthropic
+from app.config import settings
 from app.data.maindb import InvestigationDB
 from app.utils.claude_to_json import extract_json_from_response
 from app.prompts.planner import (
@@ -74,6 +75,7 @@ class PlannerAgent:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
+            **settings.agent_sampling_params(),
             system=ZERO_ITERATON_SYSTEM_PROMPT,
             messages=[
                 {"role": "user", "content": user_message}
@@ -99,10 +101,13 @@ class PlannerAgent:
         Returns:
             Dict with 'state' (general context) and 'next_steps' (list of steps).
         """
-        state = self.db.get_state_snapshot()
-    
         user_message = get_n_iteration_user_message(
-            iteration, *state
+            iteration,
+            self.db.get_initial_text(),
+            self.db.get_metadata_json(),
+            self.db.get_wrongs_json(),
+            self.db.get_context_json(),
+            self.db.get_validated_searches_json(),
         )
 
         logger.info("Generating refinement plan for iteration %d", iteration)
@@ -110,6 +115,7 @@ class PlannerAgent:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
+            **settings.agent_sampling_params(),
             system=N_ITERATION_SYSTEM_PROMPT,
             messages=[
                 {"role": "user", "content": user_message}
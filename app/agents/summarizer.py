@@ -5,6 +5,7 @@ from typing import Any
 
 from anthropic import Anthropic
 
+from app.config import settings
 from app.data.maindb import InvestigationDB
 from app.prompts.summarizer import (
     SIMILARITY_CHECK_SYSTEM_PROMPT,
@@ -13,9 +14,14 @@ from app.prompts.summarizer import (
     get_summarizer_user_message,
 )
 from app.utils.claude_to_json import extract_json_from_response
+from app.utils.text_similarity import max_cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+# Summaries at least this close (by local cosine similarity) to a stored one are
+# treated as redundant without asking the model
+LOCAL_REDUNDANCY_THRESHOLD = 0.87
+
 
 class Summarizer:
     """Summarizer agent that extracts key findings from investigation results.
@@ -64,6 +70,7 @@ class Summarizer:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=2000,
+            **settings.agent_sampling_params(),
             system=SUMMARIZER_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_message}],
         )
@@ -75,7 +82,14 @@ class Summarizer:
 
         if check_similarity:
             existing_summaries = self._get_existing_key_points()
-            if existing_summaries:
+            local_score = max_cosine_similarity(
+                self.db.vectorize_summary(summary_data), self.db.get_summary_vectors()
+            )
+            if local_score >= LOCAL_REDUNDANCY_THRESHOLD:
+                summary_data["is_redundant"] = True
+                summary_data["similarity_score"] = local_score
+                logger.info("Local similarity check: score=%.2f, redundant=True", local_score)
+            elif existing_summaries:
                 similarity_result = self._check_similarity(
                     existing_summaries, summary_data.get("key_points", [])
                 )
@@ -102,21 +116,7 @@ class Summarizer:
         Returns:
             List of key points from previous summaries, or empty list if none exist.
         """
-        try:
-            summaries = self.db.get("summaries", [])
-            if not summaries:
-                return []
-
-            all_key_points = []
-            for summary in summaries:
-                if isinstance(summary, dict) and "key_points" in summary:
-                    all_key_points.extend(summary["key_points"])
-
-            return all_key_points
-
-        except Exception as e:
-            logger.warning("Could not retrieve existing summaries: %s", str(e))
-            return []
+        return self.db.get_summary_key_points()
 
     def _check_similarity(
         self, existing_key_points: list[dict[str, Any]], new_key_points: list[dict[str, Any]]
@@ -138,6 +138,7 @@ class Summarizer:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1000,
+            **settings.agent_sampling_params(),
             system=SIMILARITY_CHECK_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_message}],
         )
@@ -1,8 +1,10 @@
 """Configuration management using Pydantic Settings."""
 
+import functools
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -33,6 +35,45 @@ Always verify your answers before presenting them to the user.""",
         description="Default system prompt for agents",
     )
 
+    agent_temperature: float | None = Field(
+        default=None,
+        description=(
+            "Sampling temperature for planner and summarizer calls; unset keeps the API "
+            "default. Set to 0 to make them deterministic and served from the LLM cache"
+        ),
+    )
+
+    def agent_sampling_params(self) -> dict[str, float]:
+        """Return the sampling kwargs for planner and summarizer requests."""
+
+        if self.agent_temperature is None:
+            return {}
+        return {"temperature": self.agent_temperature}
+
+    # Image-to-Text Configuration
+    vision_text_model: str = Field(
+        default="claude-opus-4-6",
+        description="Model for the OCR-heavy text vision pass (and the combined pass)",
+    )
+
+    vision_env_model: str = Field(
+        default="claude-haiku-4-5",
+        description="Model for the infrastructure and architecture vision passes",
+    )
+
+    i2t_cache_dir: str = Field(
+        default=".cache/i2t",
+        description="Directory for cached image-to-text features (created on first use)",
+    )
+
+    vision_combined_pass: bool = Field(
+        default=False,
+        description=(
+            "Run the text, infrastructure and architecture vision passes as one request "
+            "(one image upload and prefill) instead of three concurrent requests"
+        ),
+    )
+
 
 # Global settings instance
 settings = Settings()
@@ -41,4 +82,17 @@ settings = Settings()
 def create_anthropic_client():
     """Factory function to create an Anthropic client using settings."""
     
-    return Anthropic(api_key=settings.anthropic_api_key)
\ No newline at end of file
+    return Anthropic(api_key=settings.anthropic_api_key)
+
+
+@functools.cache
+def get_anthropic_client() -> Anthropic:
+    """Return the process-wide Anthropic client, so all callers share one connection pool."""
+
+    return create_anthropic_client()
+
+
+def create_async_anthropic_client():
+    """Factory function to create an async Anthropic client using settings."""
+
+    return AsyncAnthropic(api_key=settings.anthropic_api_key)
@@ -1,5 +1,24 @@
+import functools
+import json
+import textwrap
 from typing import Any
 
+from app.utils.cache import CacheBackend, DiskCacheBackend
+from app.utils.text_similarity import TextVector, text_vector
+
+# Final summaries of completed investigations, keyed by image hash, so identical
+# uploads are answered without a new run; kept on disk to survive restarts
+COMPLETED_INVESTIGATIONS_DIR = ".cache/investigations"
+COMPLETED_INVESTIGATIONS_MAX = 256
+# Completed investigations older than this are not reused for identical images
+CACHED_INVESTIGATION_MAX_AGE_S = 7 * 24 * 60 * 60
+
+# List fields whose JSON form is kept up to date as entries are appended. Appends
+# to the lists handed out by the accessors are detected by length; an entry that is
+# replaced or edited in place is only re-serialized once the field is reassigned
+# through db[field] = ...
+_SERIALIZED_FIELDS = ("wrongs", "context", "history_of_validated_searches")
+
 
 class InvestigationDB:
     """Dict-like database for investigation state and history.
@@ -28,6 +47,14 @@ class InvestigationDB:
         self.context: list[str] = []
         self.history_of_validated_searches: list[dict[str, Any]] = []
         self.summaries: list[dict[str, Any]] = []
+        # Columns derived from self.summaries so scans don't walk every summary dict:
+        # a bag-of-words vector per summary, and all key points flattened in order
+        self._summary_vectors: list[TextVector] = []
+        self._summary_key_points: list[dict[str, Any]] = []
+        # json.dumps(metadata, indent=2), computed on first use
+        self._metadata_json: str | None = None
+        # Per-entry json.dumps(..., indent=2) output, indented to sit inside the list
+        self._json_fragments: dict[str, list[str]] = {field: [] for field in _SERIALIZED_FIELDS}
 
     # ========== Dict-like Interface ==========
 
@@ -39,6 +66,10 @@ class InvestigationDB:
         """Set fields via dict-like syntax: db["wrongs"] = [...]"""
         if hasattr(self, key):
             setattr(self, key, value)
+            if key in _SERIALIZED_FIELDS:
+                self._rebuild_json(key)
+            elif key == "metadata":
+                self._metadata_json = None
         else:
             raise KeyError(f"Unknown field: {key}")
 
@@ -93,6 +124,7 @@ class InvestigationDB:
             wrong_entry: Dict with wrong guess data (e.g., {"guess": "...", "correction": "..."}).
         """
         self.wrongs.append(wrong_entry)
+        self._append_json("wrongs", wrong_entry)
 
     def add_context(self, hint: str) -> None:
         """Add a user-provided textual context hint.
@@ -101,6 +133,7 @@ class InvestigationDB:
             hint: String hint or contextual information.
         """
         self.context.append(hint)
+        self._append_json("context", hint)
 
     def add_validated_search(self, search_result: dict[str, Any]) -> None:
         """Add a validated search result from the validator agent.
@@ -109,6 +142,7 @@ class InvestigationDB:
             search_result: Dict with validated search data from detective/validator.
         """
         self.history_of_validated_searches.append(search_result)
+        self._append_json("history_of_validated_searches", search_result)
 
     def add_summary(self, summary: dict[str, Any]) -> None:
         """Add an investigation summary with key points.
@@ -118,19 +152,30 @@ class InvestigationDB:
                     summary, key_points, next_actions, etc.).
         """
         self.summaries.append(summary)
+        self._add_summary_columns(summary)
 
     # ========== Accessors ==========
 
     def get_wrongs(self) -> list[dict[str, Any]]:
-        """Get all recorded wrongs."""
+        """Get all recorded wrongs.
+
+        Returns the stored list; reassign db["wrongs"] after editing entries in place.
+        """
         return self.wrongs
 
     def get_context(self) -> list[str]:
-        """Get all user context hints."""
+        """Get all user context hints.
+
+        Returns the stored list; reassign db["context"] after editing entries in place.
+        """
         return self.context
 
     def get_validated_searches(self) -> list[dict[str, Any]]:
-        """Get all validated search results."""
+        """Get all validated search results.
+
+        Returns the stored list; reassign db["history_of_validated_searches"] after
+        editing entries in place.
+        """
         return self.history_of_validated_searches
 
     def get_initial_text(self) -> str:
@@ -142,13 +187,49 @@ class InvestigationDB:
         return self.initial_photo
 
     def get_metadata(self) -> dict[str, Any]:
-        """Get investigation metadata."""
+        """Get investigation metadata.
+
+        The stored dict itself is returned. After changing it in place, assign it
+        back with db["metadata"] = ... so get_metadata_json() is recomputed.
+        """
         return self.metadata
 
     def get_summaries(self) -> list[dict[str, Any]]:
         """Get all investigation summaries."""
         return self.summaries
 
+    def get_summary_vectors(self) -> list[TextVector]:
+        """Get bag-of-words vectors of all summaries, in the same order as get_summaries()."""
+        self._sync_summary_columns()
+        return self._summary_vectors
+
+    def get_summary_key_points(self) -> list[dict[str, Any]]:
+        """Get key points of all summaries as one flat list, oldest first."""
+        self._sync_summary_columns()
+        return self._summary_key_points
+
+    def get_metadata_json(self) -> str:
+        """Get investigation metadata as json.dumps(metadata, indent=2) would format it.
+
+        Computed once and kept until metadata is replaced through db["metadata"] = ...;
+        in-place edits of the dict are not seen.
+        """
+        if self._metadata_json is None:
+            self._metadata_json = json.dumps(self.metadata, indent=2)
+        return self._metadata_json
+
+    def get_wrongs_json(self) -> str:
+        """Get recorded wrongs as json.dumps(wrongs, indent=2) would format them."""
+        return self._get_json("wrongs")
+
+    def get_context_json(self) -> str:
+        """Get user context hints as json.dumps(context, indent=2) would format them."""
+        return self._get_json("context")
+
+    def get_validated_searches_json(self) -> str:
+        """Get validated searches as json.dumps(searches, indent=2) would format them."""
+        return self._get_json("history_of_validated_searches")
+
     def get_state_snapshot(self):
         return (
             self.initial_text,
@@ -157,3 +238,96 @@ class InvestigationDB:
             self.context,
             self.history_of_validated_searches,
         )
+
+    # ========== Summary Columns ==========
+
+    def _add_summary_columns(self, summary: dict[str, Any]) -> None:
+        if not isinstance(summary, dict):
+            self._summary_vectors.append({})
+            return
+        self._summary_vectors.append(self.vectorize_summary(summary))
+        self._summary_key_points.extend(summary.get("key_points", []))
+
+    def _sync_summary_columns(self) -> None:
+        # Summaries may have been replaced or extended without going through add_summary
+        if len(self._summary_vectors) == len(self.summaries):
+            return
+        self._summary_vectors = []
+        self._summary_key_points = []
+        for summary in self.summaries:
+            self._add_summary_columns(summary)
+
+    # ========== Serialized Fields ==========
+
+    @staticmethod
+    def vectorize_summary(summary: dict[str, Any]) -> TextVector:
+        """Build the vector used to compare a summary against stored ones.
+
+        Args:
+            summary: Summary dict from the summarizer agent.
+
+        Returns:
+            Bag-of-words vector over the overview and key point findings.
+        """
+        findings = [
+            point.get("finding", "")
+            for point in summary.get("key_points", [])
+            if isinstance(point, dict)
+        ]
+        return text_vector(" ".join([summary.get("summary", ""), *findings]))
+
+    def _append_json(self, field: str, entry: Any) -> None:
+        self._json_fragments[field].append(textwrap.indent(json.dumps(entry, indent=2), "  "))
+
+    def _rebuild_json(self, field: str) -> None:
+        self._json_fragments[field] = []
+        for entry in getattr(self, field):
+            self._append_json(field, entry)
+
+    def _get_json(self, field: str) -> str:
+        # Lists handed out by the accessors may have been extended in place; entries
+        # edited or replaced in place are only seen after the field is reassigned
+        if len(self._json_fragments[field]) != len(getattr(self, field)):
+            self._rebuild_json(field)
+
+        fragments = self._json_fragments[field]
+        if not fragments:
+            return "[]"
+        return "[\n" + ",\n".join(fragments) + "\n]"
+
+    # ========== Completed Investigations ==========
+
+    @staticmethod
+    def record_completed_investigation(image_hash: str, summary: dict[str, Any]) -> None:
+        """Remember the final summary of a finished investigation.
+
+        Only runs that ended on their own (converged or ran out of next steps)
+        should be recorded; a run cut off at the cycle limit is not an answer.
+
+        Args:
+            image_hash: Content hash of the investigated image.
+            summary: Final summary dict produced by the summarizer.
+        """
+        _completed_investigations().set(image_hash, summary)
+
+    @staticmethod
+    def find_cached_investigation(image_hash: str) -> dict[str, Any] | None:
+        """Find the final summary of a recent investigation of the same image.
+
+        Args:
+            image_hash: Content hash of the image to investigate.
+
+        Returns:
+            Final summary dict, or None if no recent investigation exists.
+        """
+        return _completed_investigations().get(image_hash)
+
+
+@functools.cache
+def _completed_investigations() -> CacheBackend:
+    """Return the completed-investigations store, created on first use."""
+    return DiskCacheBackend(
+        COMPLETED_INVESTIGATIONS_DIR,
+        max_entries=COMPLETED_INVESTIGATIONS_MAX,
+        ttl=CACHED_INVESTIGATION_MAX_AGE_S,
+    )
@@ -1,18 +1,19 @@
 """Orchestrates investigations with progress tracking for web interface."""
 
 import asyncio
+import hashlib
 from collections.abc import AsyncIterator
+from functools import cached_property
 from typing import Any
 
-from anthropic import Anthropic
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.agents.detective import Detective
 from app.agents.planner import PlannerAgent
 from app.agents.summarizer import Summarizer
-from app.config import settings
+from app.config import get_anthropic_client, settings
 from app.data.maindb import InvestigationDB
-from app.tools.image_to_text.image_to_text import extract_json_description_and_metadata
+from app.tools.image_to_text.image_to_text import extract_json_description_and_metadata_async
 from app.tools.maindb_tool import MainDBTool
 from app.tools.osm_search import OSMLookupTool
 from app.tools.plonkit_search.plonkit_search import PlonkitSearchTool
@@ -23,6 +24,8 @@ from app.tools.web_search import WebSearchTool
 class ProgressUpdate(BaseModel):
     """Model for progress updates sent to web frontend."""
 
+    model_config = ConfigDict(frozen=True)
+
     phase: str  # "extracting", "planning", "investigating", "summarizing", "complete"
     message: str  # Human-readable progress message
     details: dict[str, Any] | None = None  # Optional additional data
@@ -30,6 +33,49 @@ class ProgressUpdate(BaseModel):
     terminal_output: str | None = None  # Terminal log line to display
     complete: bool = False  # Whether investigation is finished
 
+    @cached_property
+    def sse_event(self) -> str:
+        """Server-Sent Event frame for this update, serialized once per instance."""
+        return f"data: {self.model_dump_json()}\n\n"
+
+
+# Updates without per-investigation data are built (and serialized) once
+_EXTRACT_VISION_START = ProgressUpdate(
+    phase="extracting",
+    message="Extracting features from image using vision API...",
+    terminal_output="[EXTRACT] Running vision API (text pass)...",
+)
+_PLAN_NO_STEPS = ProgressUpdate(
+    phase="planning",
+    message="No more steps needed",
+    terminal_output="[PLAN] No additional steps required - investigation complete",
+)
+_DETECTIVE_START = ProgressUpdate(
+    phase="investigating",
+    message="Executing investigation plan...",
+    terminal_output="[DETECTIVE] Starting investigation execution",
+)
+_DETECTIVE_DONE = ProgressUpdate(
+    phase="investigating",
+    message="Investigation execution complete",
+    terminal_output="[DETECTIVE] ✓ Investigation complete",
+)
+_SUMMARIZE_START = ProgressUpdate(
+    phase="summarizing",
+    message="Analyzing findings and extracting key insights...",
+    terminal_output="[SUMMARIZE] Extracting key findings from investigation",
+)
+_SUMMARIZE_CONVERGED = ProgressUpdate(
+    phase="summarizing",
+    message="Findings converged - investigation complete",
+    terminal_output="[SUMMARIZE] Findings converged with previous cycle - stopping",
+)
+_SUMMARIZE_SAVED = ProgressUpdate(
+    phase="summarizing",
+    message="Summary saved to database",
+    terminal_output="[SUMMARIZE] Summary saved - preparing next cycle",
+)
+
 
 class InvestigationRunner:
     """
@@ -39,17 +85,25 @@ class InvestigationRunner:
     and emits progress updates via an async queue.
     """
 
-    def __init__(self, image_path: str, mode: str = "quick"):
+    def __init__(self, image_path: str, image_bytes: bytes, mode: str = "quick"):
         """
         Initialize investigation runner.
 
+        Use InvestigationRunner.create() from async code, which reads the image
+        without blocking the event loop.
+
         Args:
             image_path: Path to image file to investigate
+            image_bytes: Contents of image_path, reused by every later stage
             mode: Investigation mode - "quick" (10 iterations) or "deep" (25 iterations)
         """
         self.image_path = image_path
         self.mode = mode
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+
+        self.image_bytes = image_bytes
+        self.image_hash = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+        self.client = get_anthropic_client()
         self.progress_queue: asyncio.Queue[ProgressUpdate] = asyncio.Queue()
         self.db: InvestigationDB | None = None
         self.final_summary: dict[str, Any] | None = None
@@ -57,6 +111,26 @@ class InvestigationRunner:
         # Set max iterations based on mode
         self.max_iterations_per_cycle = 20 if mode == "deep" else 10
 
+    @classmethod
+    async def create(cls, image_path: str, mode: str = "quick") -> "InvestigationRunner":
+        """
+        Read the image in a worker thread and build a runner for it.
+
+        Args:
+            image_path: Path to image file to investigate
+            mode: Investigation mode - "quick" or "deep"
+
+        Returns:
+            Runner holding the image contents and their hash
+        """
+        return await asyncio.to_thread(cls._from_file, image_path, mode)
+
+    @classmethod
+    def _from_file(cls, image_path: str, mode: str) -> "InvestigationRunner":
+        with open(image_path, "rb") as f:
+            image_bytes = f.read()
+        return cls(image_path, image_bytes, mode=mode)
+
     async def emit_progress(self, update: ProgressUpdate) -> None:
         """
         Emit a progress update to the queue.
@@ -87,6 +161,29 @@ class InvestigationRunner:
             Final summary dict from the investigation
         """
         try:
+            # Identical image investigated recently - reuse its final summary
+            cached_summary = await asyncio.to_thread(
+                InvestigationDB.find_cached_investigation, self.image_hash
+            )
+            if cached_summary is not None:
+                self.final_summary = cached_summary
+                await self.emit_progress(
+                    ProgressUpdate(
+                        phase="complete",
+                        message="Investigation complete",
+                        terminal_output=(
+                            "[COMPLETE] Reusing previous investigation of identical image"
+                        ),
+                        complete=True,
+                        details={
+                            "final_summary": cached_summary,
+                            "total_cycles": 0,
+                            "reason": "Cached investigation",
+                        },
+                    )
+                )
+                return cached_summary
+
             # Phase 1: Extract features from image
             await self.emit_progress(
                 ProgressUpdate(
@@ -96,16 +193,10 @@ class InvestigationRunner:
                 )
             )
 
-            await self.emit_progress(
-                ProgressUpdate(
-                    phase="extracting",
-                    message="Extracting features from image using vision API...",
-                    terminal_output="[EXTRACT] Running vision API (text pass)...",
-                )
-            )
+            await self.emit_progress(_EXTRACT_VISION_START)
 
-            features, _, metadata = await asyncio.to_thread(
-                extract_json_description_and_metadata, self.image_path
+            features, _, metadata = await extract_json_description_and_metadata_async(
+                self.image_path, image_bytes=self.image_bytes
             )
 
             # Count features across all categories
@@ -139,6 +230,7 @@ class InvestigationRunner:
                     OSMLookupTool(),
                     PlonkitSearchTool(),
                 ],
+                client=self.client,
             )
             summarizer = Summarizer(self.client, self.db, model=settings.default_model)
 
@@ -167,13 +259,7 @@ class InvestigationRunner:
                 )
 
                 if not planner_response.get("next_steps"):
-                    await self.emit_progress(
-                        ProgressUpdate(
-                            phase="planning",
-                            message="No more steps needed",
-                            terminal_output="[PLAN] No additional steps required - investigation complete",
-                        )
-                    )
+                    await self.emit_progress(_PLAN_NO_STEPS)
                     investigation_complete = True
                     break
 
@@ -198,34 +284,16 @@ class InvestigationRunner:
                     )
 
                 # Phase 3: Investigation (Detective with tool tracking)
-                await self.emit_progress(
-                    ProgressUpdate(
-                        phase="investigating",
-                        message="Executing investigation plan...",
-                        terminal_output="[DETECTIVE] Starting investigation execution",
-                    )
-                )
+                await self.emit_progress(_DETECTIVE_START)
 
                 detective_response = await self._run_detective_with_progress(
                     detective, planner_response
                 )
 
-                await self.emit_progress(
-                    ProgressUpdate(
-                        phase="investigating",
-                        message="Investigation execution complete",
-                        terminal_output="[DETECTIVE] ✓ Investigation complete",
-                    )
-                )
+                await self.emit_progress(_DETECTIVE_DONE)
 
                 # Phase 4: Summarization
-                await self.emit_progress(
-                    ProgressUpdate(
-                        phase="summarizing",
-                        message="Analyzing findings and extracting key insights...",
-                        terminal_output="[SUMMARIZE] Extracting key findings from investigation",
-                    )
-                )
+                await self.emit_progress(_SUMMARIZE_START)
 
                 summary = await asyncio.to_thread(
                     summarizer.summarize, detective_response, check_similarity=True
@@ -250,29 +318,25 @@ class InvestigationRunner:
 
                 # Check for convergence
                 if summary.get("is_redundant", False):
-                    await self.emit_progress(
-                        ProgressUpdate(
-                            phase="summarizing",
-                            message="Findings converged - investigation complete",
-                            terminal_output="[SUMMARIZE] Findings converged with previous cycle - stopping",
-                        )
-                    )
+                    await self.emit_progress(_SUMMARIZE_CONVERGED)
                     investigation_complete = True
                     self.final_summary = summary
                     self.db.add_summary(summary)
                     break
 
-                await self.emit_progress(
-                    ProgressUpdate(
-                        phase="summarizing",
-                        message="Summary saved to database",
-                        terminal_output="[SUMMARIZE] Summary saved - preparing next cycle",
-                    )
-                )
+                await self.emit_progress(_SUMMARIZE_SAVED)
 
                 self.db.add_summary(summary)
                 self.final_summary = summary
 
+            # Runs stopped at the cycle limit are not reused as answers
+            if investigation_complete and self.final_summary:
+                await asyncio.to_thread(
+                    InvestigationDB.record_completed_investigation,
+                    self.image_hash,
+                    self.final_summary,
+                )
+
             # Phase 5: Complete
             reason = "Findings converged" if investigation_complete else "Maximum cycles reached"
             await self.emit_progress(
@@ -315,12 +379,29 @@ class InvestigationRunner:
         Returns:
             Detective execution response
         """
+        loop = asyncio.get_running_loop()
+
+        def on_iteration(log_entry: dict[str, Any]) -> None:
+            # Called from the detective's worker thread; hand updates to the event loop
+            for tool_call in log_entry.get("tool_calls", []):
+                tool_display = self._tool_name_to_display(tool_call.get("tool_name", "unknown"))
+                update = ProgressUpdate(
+                    phase="investigating",
+                    message="Investigating with tools",
+                    terminal_output=(
+                        f"[DETECTIVE]   Iteration {log_entry['iteration']}: {tool_display}"
+                    ),
+                )
+                loop.call_soon_threadsafe(self.progress_queue.put_nowait, update)
+
         # Run investigation with mode-specific max iterations
         result = await asyncio.to_thread(
-            detective.investigate_with_plan, plan, max_iterations=self.max_iterations_per_cycle
+            detective.investigate_with_plan,
+            plan,
+            max_iterations=self.max_iterations_per_cycle,
+            on_iteration=on_iteration,
         )
 
-        # Extract tool usage details from execution log
         if result.get("execution_log"):
             iteration_count = len(result["execution_log"])
             await self.emit_progress(
@@ -331,21 +412,6 @@ class InvestigationRunner:
                 )
             )
 
-            # Log tool usage from execution log
-            for i, log_entry in enumerate(result["execution_log"], 1):
-                tool_calls = log_entry.get("tool_calls", [])
-                if tool_calls:
-                    for tool_call in tool_calls:
-                        tool_name = tool_call.get("tool_name", "unknown")
-                        tool_display = self._tool_name_to_display(tool_name)
-                        await self.emit_progress(
-                            ProgressUpdate(
-                                phase="investigating",
-                                message="Processing investigation results",
-                                terminal_output=f"[DETECTIVE]   Iteration {i}: {tool_display}",
-                            )
-                        )
-
         return result
 
     def _tool_name_to_display(self, tool_name: str) -> str:
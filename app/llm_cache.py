@@ -0,0 +1,76 @@
+"""Exact-match response cache for deterministic Anthropic calls."""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from anthropic import Anthropic
+from anthropic.types import Message
+
+from app.utils.cache import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Request parameters that determine the response of a temperature=0 call
+_KEY_PARAMS = ("model", "system", "messages", "tools", "tool_choice", "max_tokens", "temperature")
+
+
+class _CachingMessages:
+    """Stand-in for `client.messages` that serves repeated requests from the cache."""
+
+    def __init__(self, owner: "CachingAnthropicClient"):
+        self._owner = owner
+
+    def create(self, **kwargs: Any) -> Message:
+        return self._owner._create_message(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._owner.client.messages, name)
+
+
+class CachingAnthropicClient:
+    """Wraps an Anthropic client and caches `messages.create` responses.
+
+    Only requests with temperature=0 are cached, since only those are expected to
+    produce the same response for the same input. Everything else is passed through
+    to the wrapped client unchanged.
+    """
+
+    def __init__(self, client: Anthropic, backend: CacheBackend):
+        """Initialize caching client.
+
+        Args:
+            client: Anthropic client used on cache misses.
+            backend: Cache storage for serialized responses.
+        """
+        self.client = client
+        self.backend = backend
+        self.messages = _CachingMessages(self)
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _create_message(self, **kwargs: Any) -> Message:
+        if kwargs.get("temperature") != 0:
+            return self.client.messages.create(**kwargs)
+
+        key = self._cache_key(kwargs)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.info("LLM cache hit (hits=%d, misses=%d)", self.hits, self.misses)
+            return Message.model_validate(cached)
+
+        self.misses += 1
+        response = self.client.messages.create(**kwargs)
+        self.backend.set(key, response.model_dump(mode="json"))
+        return response
+
+    @staticmethod
+    def _cache_key(kwargs: dict[str, Any]) -> str:
+        request = {name: kwargs.get(name) for name in _KEY_PARAMS}
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -1,125 +1,221 @@
-from anthropic import Anthropic
+import asyncio
+import logging
+import sys
+from logging.handlers import MemoryHandler
 
 from app.agents.detective import Detective
 from app.agents.planner import PlannerAgent
 from app.agents.summarizer import Summarizer
-from app.config import settings
+from app.config import get_anthropic_client, settings
 from app.data.maindb import InvestigationDB
-from app.tools.image_to_text.image_to_text import extract_json_description_and_metadata
+from app.llm_cache import CachingAnthropicClient
+from app.tools.cached_tool import CachedTool
+from app.tools.image_to_text.image_to_text import extract_json_description_and_metadata_async
 from app.tools.maindb_tool import MainDBTool
 from app.tools.osm_search import OSMLookupTool
 from app.tools.plonkit_search.plonkit_search import PlonkitSearchTool
 from app.tools.web_scraper import WebScraperTool
 from app.tools.web_search import WebSearchTool
+from app.utils.cache import DiskCacheBackend
 
-client = Anthropic(api_key=settings.anthropic_api_key)
+client = get_anthropic_client()
+
+# With AGENT_TEMPERATURE=0, repeated test runs on the same image re-issue identical
+# planner and summarizer prompts; at any other temperature the cache would never hit
+LLM_CACHE_DIR = ".cache/llm"
+LLM_CACHE_TTL_S = 7 * 24 * 60 * 60
+
+# Lookup tools are re-queried with the same arguments across cycles and runs;
+# TTLs follow how quickly each source changes
+TOOL_CACHE_DIR = ".cache/tools"
+WEB_SEARCH_CACHE_TTL_S = 60 * 60
+OSM_LOOKUP_CACHE_TTL_S = 24 * 60 * 60
+PLONKIT_CACHE_TTL_S = 7 * 24 * 60 * 60
+
+# Pipeline progress output is buffered and written out at phase boundaries
+# (or immediately on errors) instead of one write per line
+log = logging.getLogger("pipeline")
+_log_handler = MemoryHandler(
+    4096, flushLevel=logging.ERROR, target=logging.StreamHandler(sys.stdout)
+)
+
+
+class _BannerFormatter(logging.Formatter):
+    """Frames records logged with extra={"banner": char} between separator lines."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        banner = getattr(record, "banner", None)
+        if banner:
+            line = banner * 80
+            return f"\n{line}\n{message}\n{line}"
+        return message
+
+
+def _configure_pipeline_log():
+    if _log_handler in log.handlers:
+        return
+    _log_handler.target.setFormatter(_BannerFormatter("%(message)s"))
+    log.addHandler(_log_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
 
 
 def main():
     print("Hello from o-agent!")
 
 
-def run_test_loop():
+def _log_detective_iteration(entry: dict) -> None:
+    tool_summary = ", ".join(tc["tool_name"] for tc in entry["tool_calls"])
+    log.info("  Iteration %s: [%s]", entry["iteration"], tool_summary)
+    _log_handler.flush()
+
+
+async def run_test_loop():
+    _configure_pipeline_log()
     path = "app/images/pole.png"
-    print(f"Running test loop with image: {path}")
-    features, _, metadata = extract_json_description_and_metadata(path)
-    print("Extracted features:")
-    print(features)
-    print("Extracted metadata:")
-    print(metadata)
+    log.info("Running test loop with image: %s", path)
+    features, _, metadata = await extract_json_description_and_metadata_async(path)
+    log.info("Extracted features:\n%s", features)
+    log.info("Extracted metadata:\n%s", metadata)
+    _log_handler.flush()
 
     db = InvestigationDB(initial_photo=path, initial_text=features, metadata=metadata)
 
-    planner = PlannerAgent(client, db, model=settings.default_model)
+    llm_cache = None
+    if settings.agent_temperature == 0:
+        llm_cache = CachingAnthropicClient(
+            client, DiskCacheBackend(LLM_CACHE_DIR, ttl=LLM_CACHE_TTL_S)
+        )
+    llm_client = llm_cache if llm_cache is not None else client
+    planner = PlannerAgent(llm_client, db, model=settings.default_model)
+    tool_cache = DiskCacheBackend(TOOL_CACHE_DIR)
+    web_search = CachedTool(
+        WebSearchTool(), tool_cache, ttl=WEB_SEARCH_CACHE_TTL_S, fuzzy_arg="query"
+    )
+    osm_lookup = CachedTool(OSMLookupTool(), tool_cache, ttl=OSM_LOOKUP_CACHE_TTL_S)
+    plonkit_search = CachedTool(PlonkitSearchTool(), tool_cache, ttl=PLONKIT_CACHE_TTL_S)
+    cached_tools = [web_search, osm_lookup, plonkit_search]
     detective = Detective(
         db=db,
         tools=[
             MainDBTool(db),
-            WebSearchTool(),
+            web_search,
             WebScraperTool(),
-            OSMLookupTool(),
-            PlonkitSearchTool(),
+            osm_lookup,
+            plonkit_search,
         ],
+        client=client,
     )
-    summarizer = Summarizer(client, db, model=settings.default_model)
+    summarizer = Summarizer(llm_client, db, model=settings.default_model)
 
     max_outer_loops = 5  # Maximum number of planner-detective-summarizer cycles
     investigation_complete = False
     outer_iteration = 0
     final_summary = None
+    # Next cycle's plan, requested while the current cycle is being summarized
+    next_plan_task: asyncio.Task | None = None
 
-    print("\n" + "=" * 80)
-    print("STARTING INVESTIGATION PIPELINE")
-    print("=" * 80)
+    log.info("STARTING INVESTIGATION PIPELINE", extra={"banner": "="})
 
     while not investigation_complete and outer_iteration < max_outer_loops:
         outer_iteration += 1
 
-        print(f"\n{'=' * 80}")
-        print(f"PIPELINE CYCLE {outer_iteration}/{max_outer_loops}")
-        print(f"{'=' * 80}")
+        log.info("PIPELINE CYCLE %d/%d", outer_iteration, max_outer_loops, extra={"banner": "="})
 
-        print("\n[PHASE 1: PLANNER]")
-        print("Analyzing investigation state and creating plan...")
-        planner_response = planner.plan(iteration=outer_iteration - 1)
+        log.info("\n[PHASE 1: PLANNER]")
+        if next_plan_task is not None:
+            log.info("Using plan prepared during previous summarization...")
+            planner_response = await next_plan_task
+            next_plan_task = None
+        else:
+            log.info("Analyzing investigation state and creating plan...")
+            _log_handler.flush()
+            planner_response = await asyncio.to_thread(planner.plan, iteration=outer_iteration - 1)
 
-        print(f"  Plan created with {len(planner_response.get('next_steps', []))} steps")
-        print(f"  State summary: {planner_response.get('state', '')[:200]}...")
+        log.info("  Plan created with %d steps", len(planner_response.get("next_steps", [])))
+        log.info("  State summary: %.200s...", planner_response.get("state", ""))
 
         # Check if planner indicates investigation is complete
         if not planner_response.get("next_steps"):
-            print("\n✓ PLANNER: No more investigation steps needed. Investigation complete.")
+            log.info("\n✓ PLANNER: No more investigation steps needed. Investigation complete.")
             investigation_complete = True
             break
+        _log_handler.flush()
+
+        log.info("\n[PHASE 2: DETECTIVE]")
+        log.info("Executing investigation plan (max 10 iterations per cycle)...")
+        _log_handler.flush()
+        detective_response = await asyncio.to_thread(
+            detective.investigate_with_plan,
+            planner_response,
+            max_iterations=10,
+            on_iteration=_log_detective_iteration,
+        )
 
-
-        print("\n[PHASE 2: DETECTIVE]")
-        print("Executing investigation plan (max 10 iterations per cycle)...")
-        detective_response = detective.investigate_with_plan(planner_response, max_iterations=10)
-
-        print("\n  Detective execution complete:")
-        print(f"  Status: {detective_response['status']}")
-        print(f"  Iterations used: {detective_response['iterations']}/10")
-        print(f"  Plan steps: {detective_response['total_steps']}")
+        log.info("\n  Detective execution complete:")
+        log.info("  Status: %s", detective_response["status"])
+        log.info("  Iterations used: %s/10", detective_response["iterations"])
+        log.info("  Plan steps: %s", detective_response["total_steps"])
 
         if detective_response["status"] == "partial":
-            print(" Warning: Detective hit iteration limit before completing all steps")
+            log.warning(" Warning: Detective hit iteration limit before completing all steps")
         elif detective_response["status"] == "error":
-            print(f"Error: {detective_response.get('error', 'Unknown error')}")
-
-        print("\n  Tool usage summary:")
-        for log in detective_response["execution_log"]:
-            tool_summary = ", ".join([tc["tool_name"] for tc in log["tool_calls"]])
-            print(f"Iteration {log['iteration']}: [{tool_summary}]")
+            log.error("Error: %s", detective_response.get("error", "Unknown error"))
 
         final_response = detective_response.get("final_response", "")
         if final_response:
-            print(f"\n  Detective's summary: {final_response[:300]}...")
-
-        print("\n[PHASE 3: SUMMARIZER]")
-        print("Extracting key findings and checking for redundancy...")
-
-        summary = summarizer.summarize(detective_response, check_similarity=True)
+            log.info("\n  Detective's summary: %.300s...", final_response)
+        _log_handler.flush()
+
+        log.info("\n[PHASE 3: SUMMARIZER]")
+        log.info("Extracting key findings and checking for redundancy...")
+        _log_handler.flush()
+
+        # The planner only reads the detective's findings (not summaries), so the next
+        # plan can be requested while the summarizer is still running. Only done while
+        # there are no stored summaries: redundancy (the early stop) is judged against
+        # them, so the prefetched plan is then certain to be used. A planner call in a
+        # worker thread cannot be aborted once started.
+        if outer_iteration < max_outer_loops and not db.get_summaries():
+            next_plan_task = asyncio.create_task(
+                asyncio.to_thread(planner.plan, iteration=outer_iteration)
+            )
 
-        print("Summary generated:")
-        print(f"  Overview: {summary.get('summary', 'N/A')[:150]}...")
-        print(f"  Key points: {len(summary.get('key_points', []))}")
-        print(f"  Similarity score: {summary.get('similarity_score', 0.0):.2f}")
-        print(f"  Is redundant: {summary.get('is_redundant', False)}")
+        try:
+            summary = await asyncio.to_thread(
+                summarizer.summarize, detective_response, check_similarity=True
+            )
+        except BaseException:
+            # Don't leave the prefetch unawaited; its thread still runs to completion
+            if next_plan_task is not None:
+                next_plan_task.cancel()
+            raise
+
+        log.info("Summary generated:")
+        log.info("  Overview: %.150s...", summary.get("summary", "N/A"))
+        log.info("  Key points: %d", len(summary.get("key_points", [])))
+        log.info("  Similarity score: %.2f", summary.get("similarity_score", 0.0))
+        log.info("  Is redundant: %s", summary.get("is_redundant", False))
 
         if summary.get("key_points"):
-            print("\n  Key findings this iteration:")
+            log.info("\n  Key findings this iteration:")
             for i, point in enumerate(summary.get("key_points", [])[:3], 1):
-                category = point.get("category", "unknown")
-                finding = point.get("finding", "")[:80]
-                confidence = point.get("confidence", "unknown")
-                print(f"{i}. [{category}] {finding}... (confidence: {confidence})")
+                log.info(
+                    "%d. [%s] %.80s... (confidence: %s)",
+                    i,
+                    point.get("category", "unknown"),
+                    point.get("finding", ""),
+                    point.get("confidence", "unknown"),
+                )
 
         if summary.get("is_redundant", False):
-            print("\n" + "!" * 80)
-            print("STOP CONDITION MET: FINDINGS ARE REDUNDANT")
-            print("Investigation has converged - no new meaningful progress detected.")
-            print("!" * 80)
+            log.info(
+                "STOP CONDITION MET: FINDINGS ARE REDUNDANT\n"
+                "Investigation has converged - no new meaningful progress detected.",
+                extra={"banner": "!"},
+            )
+            _log_handler.flush()
             investigation_complete = True
             final_summary = summary
             db.add_summary(summary)
@@ -127,69 +223,76 @@ def run_test_loop():
 
         db.add_summary(summary)
         final_summary = summary
-        print(f" Summary saved to database ({len(db.get_summaries())} total summaries)")
+        log.info(" Summary saved to database (%d total summaries)", len(db.get_summaries()))
 
-        print(
-            f"\n[PIPELINE] Cycle {outer_iteration} complete. "
-            "Findings show progress - continuing to next iteration."
+        log.info(
+            "\n[PIPELINE] Cycle %d complete. "
+            "Findings show progress - continuing to next iteration.",
+            outer_iteration,
         )
+        _log_handler.flush()
 
     # ===== FINAL SUMMARY =====
-    print("\n" + "=" * 80)
-    print("INVESTIGATION PIPELINE COMPLETE")
-    print("=" * 80)
-    print(f"Total pipeline cycles: {outer_iteration}/{max_outer_loops}")
+    log.info("INVESTIGATION PIPELINE COMPLETE", extra={"banner": "="})
+    log.info("Total pipeline cycles: %d/%d", outer_iteration, max_outer_loops)
 
     if investigation_complete:
         stop_reason = "Redundancy detected (findings converged)"
     else:
         stop_reason = "Maximum cycles reached"
-    print(f"Stop reason: {stop_reason}")
+    log.info("Stop reason: %s", stop_reason)
 
     if final_summary:
-        print("\n" + "=" * 80)
-        print("FINAL INVESTIGATION SUMMARY")
-        print("=" * 80)
+        log.info("FINAL INVESTIGATION SUMMARY", extra={"banner": "="})
 
-        print("\nOverall Summary:")
-        print(f"  {final_summary.get('summary', 'N/A')}")
+        log.info("\nOverall Summary:")
+        log.info("  %s", final_summary.get("summary", "N/A"))
 
-        print("\n--- KEY FINDINGS ---")
+        log.info("\n--- KEY FINDINGS ---")
         for i, point in enumerate(final_summary.get("key_points", []), 1):
-            print(f"\n{i}. [{point.get('category', 'unknown').upper()}]")
-            print(f"   Finding: {point.get('finding', '')}")
+            log.info("\n%d. [%s]", i, point.get("category", "unknown").upper())
+            log.info("   Finding: %s", point.get("finding", ""))
 
-        print("\n--- LOCATION GUESS ---")
+        log.info("\n--- LOCATION GUESS ---")
         point = final_summary.get("final_guess", [])
-            
-        print(f"   Coordinates: {point.get('latitude', '')} {point.get('longitude', '')}")
-        print(f"   Confidence radius: {point.get('confidence_radius_km', '')}")
-        print(f"   Location name: {point.get('location_name', '')}")
-        print(f"   Reasoning: {point.get('reasoning', '')}")
+
+        log.info("   Coordinates: %s %s", point.get("latitude", ""), point.get("longitude", ""))
+        log.info("   Confidence radius: %s", point.get("confidence_radius_km", ""))
+        log.info("   Location name: %s", point.get("location_name", ""))
+        log.info("   Reasoning: %s", point.get("reasoning", ""))
 
         if final_summary.get("next_actions"):
-            print("\n--- RECOMMENDED NEXT ACTIONS ---")
+            log.info("\n--- RECOMMENDED NEXT ACTIONS ---")
             for i, action in enumerate(final_summary.get("next_actions", []), 1):
-                print(f"{i}. {action}")
+                log.info("%d. %s", i, action)
 
         # Display investigation progression
         all_summaries = db.get_summaries()
-        print("\n--- INVESTIGATION PROGRESSION ---")
-        print(f"Total summaries: {len(all_summaries)}")
+        log.info("\n--- INVESTIGATION PROGRESSION ---")
+        log.info("Total summaries: %d", len(all_summaries))
         for idx, summ in enumerate(all_summaries):
-            print(
-                f"  Iteration {idx}: {summ.get('summary', 'N/A')[:200]}... "
-            )
-
-    print("\n--- DATABASE STATE ---")
-    print(f"Validated searches: {len(db.get_validated_searches())}")
-    print(f"Summaries: {len(db.get_summaries())}")
-    print(f"User corrections: {len(db.get_wrongs())}")
-    print(f"Context hints: {len(db.get_context())}")
+            log.info("  Iteration %d: %.200s... ", idx, summ.get("summary", "N/A"))
+
+    log.info("\n--- DATABASE STATE ---")
+    log.info("Validated searches: %d", len(db.get_validated_searches()))
+    log.info("Summaries: %d", len(db.get_summaries()))
+    log.info("User corrections: %d", len(db.get_wrongs()))
+    log.info("Context hints: %d", len(db.get_context()))
+    if llm_cache is not None:
+        log.info("LLM response cache: %d hits, %d misses", llm_cache.hits, llm_cache.misses)
+    for tool in cached_tools:
+        log.info(
+            "Tool cache (%s): %d hits, %d fuzzy hits, %d misses",
+            tool.get_name(),
+            tool.hits,
+            tool.fuzzy_hits,
+            tool.misses,
+        )
+    _log_handler.flush()
 
     return final_summary
 
 
 if __name__ == "__main__":
     main()
-    run_test_loop()
\ No newline at end of file
+    asyncio.run(run_test_loop())
\ No newline at end of file
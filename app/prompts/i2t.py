@@ -1,3 +1,6 @@
+# Bump whenever any prompt below changes, so cached extraction results are invalidated
+PROMPT_VERSION = 1
+
 # =============================================================================
 # CATEGORY 0: TEXT 
 # =============================================================================
@@ -189,4 +192,28 @@ Return ONLY this JSON:
   }
 }
 
-"""
\ No newline at end of file
+"""
+
+
+# =============================================================================
+# COMBINED: all three passes in a single request
+# =============================================================================
+COMBINED_PASS_PROMPT = f"""
+Perform the three independent analyses below on the same image.
+
+Return ONLY one valid JSON object with exactly these keys:
+- "textual_features": the JSON object requested by ANALYSIS 1
+- "infrastructure_features": the JSON object requested by ANALYSIS 2
+- "architecture_features": the JSON object requested by ANALYSIS 3
+
+Apply each analysis's rules only to its own key.
+
+=== ANALYSIS 1 ===
+{TEXT_PASS_PROMPT}
+
+=== ANALYSIS 2 ===
+{ENV_INFRASTRUCTURE_PROMPT}
+
+=== ANALYSIS 3 ===
+{ENV_ARCHITECTURE_PROMPT}
+"""
@@ -90,20 +90,21 @@ Analyze the completeness of this information and structure a detailed investigat
 def get_n_iteration_user_message(
     iteration: int,
     initial_text: str,
-    metadata: Any,
-    wrongs: Any,
-    context: Any,
-    validated_searches: Any,
+    metadata_json: str,
+    wrongs_json: str,
+    context_json: str,
+    validated_searches_json: str,
 ) -> str:
     """Generate user message for investigation plan refinement.
 
     Args:
         iteration: Current iteration number.
         initial_text: Extracted text from the initial source.
-        metadata: Metadata about the source.
-        wrongs: Incorrect guesses from previous iterations.
-        context: User-provided context hints.
-        validated_searches: Validated search results from previous iterations.
+        metadata_json: Metadata about the source, serialized as JSON.
+        wrongs_json: Incorrect guesses from previous iterations, serialized as JSON.
+        context_json: User-provided context hints, serialized as JSON.
+        validated_searches_json: Validated search results from previous iterations,
+            serialized as JSON.
 
     Returns:
         Formatted user message for the planner.
@@ -114,16 +115,16 @@ INITIAL TEXT EXTRACTION:
 {initial_text}
 
 METADATA:
-{json.dumps(metadata, indent=2)}
+{metadata_json}
 
 INCORRECT GUESSES:
-{json.dumps(wrongs, indent=2)}
+{wrongs_json}
 
 USER CONTEXT HINTS:
-{json.dumps(context, indent=2)}
+{context_json}
 
 VALIDATED SEARCH RESULTS:
-{json.dumps(validated_searches, indent=2)}
+{validated_searches_json}
 
 Based on all this information, what should the Detective Agent investigate next? Focus on unexplored angles and new leads that have emerged."""
 
@@ -1,5 +1,7 @@
 """Prompts for the Summarizer agent."""
 
+import reprlib
+
 SUMMARIZER_SYSTEM_PROMPT = """You are an OSINT investigation summarizer.
 
 Your task is to analyze the execution log from a geolocation investigation and extract
@@ -62,6 +64,12 @@ FINAL GUESS GUIDELINES:
 """
 
 
+# Renders at most ~200 characters' worth of a tool result, without walking all of it
+_RESULT_REPR = reprlib.Repr(
+    maxlevel=3, maxdict=8, maxlist=8, maxtuple=8, maxset=8, maxstring=80, maxother=200
+)
+
+
 def get_summarizer_user_message(detective_response: dict) -> str:
     """Generate user message for summarizer with detective results.
 
@@ -77,7 +85,8 @@ def get_summarizer_user_message(detective_response: dict) -> str:
     final_response = detective_response.get("final_response", "")
     execution_log = detective_response.get("execution_log", [])
 
-    message = f"""INVESTIGATION SUMMARY REQUEST
+    parts = [
+        f"""INVESTIGATION SUMMARY REQUEST
 
 Investigation Status: {status}
 Total Iterations: {iterations}
@@ -87,17 +96,18 @@ FINAL AGENT RESPONSE:
 
 EXECUTION LOG:
 """
+    ]
 
     for log_entry in execution_log:
         iteration = log_entry.get("iteration", "?")
         reasoning = log_entry.get("agent_reasoning", "")
         tool_calls = log_entry.get("tool_calls", [])
 
-        message += f"\n--- Iteration {iteration} ---\n"
+        parts.append(f"\n--- Iteration {iteration} ---\n")
         if len(reasoning) > 300:
-            message += f"Reasoning: {reasoning[:300]}...\n"
+            parts.append(f"Reasoning: {reasoning[:300]}...\n")
         else:
-            message += f"Reasoning: {reasoning}\n"
+            parts.append(f"Reasoning: {reasoning}\n")
 
         for tc in tool_calls:
             tool_name = tc.get("tool_name", "unknown")
@@ -106,21 +116,24 @@ EXECUTION LOG:
             error = tc.get("error")
 
             status_icon = "✓" if success else "✗"
-            message += f"  {status_icon} {tool_name}: "
+            parts.append(f"  {status_icon} {tool_name}: ")
+            if tc.get("fuzzy_match_of"):
+                parts.append(f"(reused result of similar query {tc['fuzzy_match_of']!r}) ")
 
             if error:
-                message += f"ERROR - {error}\n"
+                parts.append(f"ERROR - {error}\n")
             else:
-                # Truncate result for readability
-                result_str = str(result)
+                # Truncate result for readability; containers are rendered with a bounded
+                # repr so a large result is never stringified in full just to be cut
+                result_str = result if isinstance(result, str) else _RESULT_REPR.repr(result)
                 if len(result_str) > 200:
-                    message += f"{result_str[:200]}...\n"
+                    parts.append(f"{result_str[:200]}...\n")
                 else:
-                    message += f"{result_str}\n"
+                    parts.append(f"{result_str}\n")
 
-    message += "\nPlease analyze this investigation log and extract key findings."
+    parts.append("\nPlease analyze this investigation log and extract key findings.")
 
-    return message
+    return "".join(parts)
 
 
 SIMILARITY_CHECK_SYSTEM_PROMPT = """You are comparing key findings from OSINT investigations.
@@ -160,19 +173,25 @@ def get_similarity_check_message(existing_key_points: list, new_key_points: list
     Returns:
         Formatted comparison message.
     """
-    message = """SIMILARITY CHECK REQUEST
+    parts = [
+        """SIMILARITY CHECK REQUEST
 
 EXISTING KEY POINTS:
 """
-    for i, point in enumerate(existing_key_points, 1):
-        message += f"{i}. [{point.get('category', 'unknown')}] {point.get('finding', '')} "
-        message += f"(confidence: {point.get('confidence', 'unknown')})\n"
+    ]
+    parts.extend(_format_key_points(existing_key_points))
+
+    parts.append("\nNEW KEY POINTS:\n")
+    parts.extend(_format_key_points(new_key_points))
+
+    parts.append("\nAre these findings substantially similar or do they show meaningful progress?")
 
-    message += "\nNEW KEY POINTS:\n"
-    for i, point in enumerate(new_key_points, 1):
-        message += f"{i}. [{point.get('category', 'unknown')}] {point.get('finding', '')} "
-        message += f"(confidence: {point.get('confidence', 'unknown')})\n"
+    return "".join(parts)
 
-    message += "\nAre these findings substantially similar or do they show meaningful progress?"
 
-    return message
\ No newline at end of file
+def _format_key_points(key_points: list):
+    for i, point in enumerate(key_points, 1):
+        yield (
+            f"{i}. [{point.get('category', 'unknown')}] {point.get('finding', '')} "
+            f"(confidence: {point.get('confidence', 'unknown')})\n"
+        )
@@ -1,33 +1,49 @@
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
 
+@dataclass(slots=True)
+class ToolResult:
+    """Result from a tool execution.
 
-class ToolResult(BaseModel):
-    """Result from a tool execution."""
+    A plain dataclass rather than a pydantic model: results are only ever built by
+    our own tools, so validating every one of them is wasted work.
 
-    success: bool = Field(..., description="Whether the tool executed successfully")
-    data: Any = Field(None, description="The result data from the tool")
-    error: str | None = Field(None, description="Error message if execution failed")
-    metadata: dict[str, Any] = Field(
-        default_factory=dict, description="Additional metadata about the execution"
-    )
+    Attributes:
+        success: Whether the tool executed successfully
+        data: The result data from the tool
+        error: Error message if execution failed
+        metadata: Additional metadata about the execution
+    """
+
+    success: bool
+    data: Any = None
+    error: str | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class BaseTool:
-    """Base class for all agent tools"""
+    """Base class for all agent tools
+
+    Subclasses describe themselves through the name, description and parameters
+    class attributes, which are built once at import rather than on every call.
+    """
+
+    name: ClassVar[str]
+    description: ClassVar[str]
+    parameters: ClassVar[dict[str, Any]]
 
     def get_name(self) -> str:
         """Returns the tool name"""
-        raise NotImplementedError
+        return self.name
 
     def get_description(self) -> str:
         """Returns what the tool does"""
-        raise NotImplementedError
+        return self.description
 
     def get_parameters(self) -> dict[str, Any]:
         """Returns the parameter schema for the tool"""
-        raise NotImplementedError
+        return self.parameters
 
     def execute(self, **kwargs) -> ToolResult:
         """Executes the tool with given parameters"""
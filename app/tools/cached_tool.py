@@ -0,0 +1,129 @@
+import dataclasses
+import difflib
+import hashlib
+import json
+import logging
+from typing import Any
+
+from app.tools.base_tool import BaseTool, ToolResult
+from app.utils.cache import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Number of previously cached argument sets kept for fuzzy lookup, per tool
+FUZZY_INDEX_SIZE = 256
+
+
+class CachedTool(BaseTool):
+    """Wraps a tool and serves repeated calls with the same arguments from a cache.
+
+    Only successful results are cached, so transient failures are retried on the
+    next call. With fuzzy_arg set, a call whose value for that argument is nearly
+    identical to a cached one (other arguments equal) reuses that result; the
+    matched value is recorded as metadata["fuzzy_match_of"].
+    """
+
+    def __init__(
+        self,
+        inner: BaseTool,
+        backend: CacheBackend,
+        ttl: float | None = None,
+        fuzzy_arg: str | None = None,
+        fuzzy_cutoff: float = 0.95,
+    ):
+        """Initialize cached tool.
+
+        Args:
+            inner: Tool whose results are cached.
+            backend: Cache storage for serialized results.
+            ttl: Time-to-live in seconds for cached results, or None for the backend default.
+            fuzzy_arg: String argument matched approximately on exact-match misses
+                (only for tools where a near-duplicate result is harmless, e.g. search).
+            fuzzy_cutoff: Minimum difflib similarity ratio for a fuzzy match.
+        """
+        self.inner = inner
+        self.backend = backend
+        self.ttl = ttl
+        self.fuzzy_arg = fuzzy_arg
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+    def get_name(self) -> str:
+        return self.inner.get_name()
+
+    def get_description(self) -> str:
+        return self.inner.get_description()
+
+    def get_parameters(self) -> dict[str, Any]:
+        return self.inner.get_parameters()
+
+    def execute(self, **kwargs) -> ToolResult:
+        """Returns the cached result for these arguments, or executes the wrapped tool."""
+        key = self._cache_key(kwargs)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.info("Tool cache hit for %s", self.get_name())
+            return self._from_cache(cached)
+
+        if self.fuzzy_arg is not None:
+            result = self._fuzzy_lookup(kwargs)
+            if result is not None:
+                return result
+
+        self.misses += 1
+        result = self.inner.execute(**kwargs)
+        if result.success:
+            self.backend.set(key, dataclasses.asdict(result), ttl=self.ttl)
+            if isinstance(kwargs.get(self.fuzzy_arg), str):
+                self._add_to_fuzzy_index(kwargs)
+        return result
+
+    def _cache_key(self, kwargs: dict[str, Any]) -> str:
+        args = json.dumps(kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(f"{self.get_name()}|{args}".encode()).hexdigest()
+
+    @property
+    def _fuzzy_index_key(self) -> str:
+        return f"{self.get_name()}-fuzzy-index"
+
+    def _fuzzy_lookup(self, kwargs: dict[str, Any]) -> ToolResult | None:
+        value = kwargs.get(self.fuzzy_arg)
+        if not isinstance(value, str):
+            return None
+
+        # Candidates must agree on every argument except the fuzzy one
+        others = {k: v for k, v in kwargs.items() if k != self.fuzzy_arg}
+        candidates = {
+            entry[self.fuzzy_arg]: entry
+            for entry in self.backend.get(self._fuzzy_index_key) or []
+            if {k: v for k, v in entry.items() if k != self.fuzzy_arg} == others
+        }
+        matches = difflib.get_close_matches(value, candidates, n=1, cutoff=self.fuzzy_cutoff)
+        if not matches:
+            return None
+
+        cached = self.backend.get(self._cache_key(candidates[matches[0]]))
+        if cached is None:
+            return None
+
+        self.fuzzy_hits += 1
+        logger.info("Tool cache fuzzy hit for %s: %r ~ %r", self.get_name(), value, matches[0])
+        result = self._from_cache(cached)
+        result.metadata["fuzzy_match_of"] = matches[0]
+        return result
+
+    @staticmethod
+    def _from_cache(cached: dict[str, Any]) -> ToolResult:
+        # Memory backends hand out the stored dict itself, so the result gets its own
+        # metadata dict that callers can extend without touching the cache
+        return ToolResult(**{**cached, "metadata": dict(cached.get("metadata") or {})})
+
+    def _add_to_fuzzy_index(self, kwargs: dict[str, Any]) -> None:
+        index = [
+            entry for entry in self.backend.get(self._fuzzy_index_key) or [] if entry != kwargs
+        ]
+        index.append(kwargs)
+        self.backend.set(self._fuzzy_index_key, index[-FUZZY_INDEX_SIZE:], ttl=self.ttl)
@@ -1,19 +1,74 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from anthropic import AsyncAnthropic
 
 import app.tools.image_to_text.preprocessing as preprocessing
 from app.tools.image_to_text.metadata import extract_image_metadata_for_agent
 from app.utils.claude_to_json import extract_json_from_response
 
-from app.config import settings, create_anthropic_client
-from app.prompts.i2t import TEXT_PASS_PROMPT, ENV_ARCHITECTURE_PROMPT, ENV_INFRASTRUCTURE_PROMPT
+from app.config import settings, get_anthropic_client, create_async_anthropic_client
+from app.prompts.i2t import (
+    COMBINED_PASS_PROMPT,
+    PROMPT_VERSION,
+    TEXT_PASS_PROMPT,
+    ENV_ARCHITECTURE_PROMPT,
+    ENV_INFRASTRUCTURE_PROMPT,
+)
+from app.utils.cache import DiskCacheBackend
+from app.utils.image_hash import dhash, hamming_distance, pixel_digest
+
+client = get_anthropic_client()
+
+# A stuck pass should fail on its own instead of holding up the other two
+VISION_REQUEST_TIMEOUT_S = 120
+
+# Threads for the sync vision passes, created once and reused by every extraction
+VISION_POOL_WORKERS = 8
+_VISION_POOL = ThreadPoolExecutor(
+    max_workers=VISION_POOL_WORKERS, thread_name_prefix="claude-vision"
+)
+atexit.register(_VISION_POOL.shutdown)
+
+# Upper bound on vision requests in flight at once, shared by all async extractions
+# running on the same event loop
+VISION_MAX_CONCURRENCY = 3
+
+# Async client and semaphore per event loop: both are bound to the loop they are
+# first used on, so a client reused by a later asyncio.run() would fail
+_loop_vision_resources: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[AsyncAnthropic, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+# Image decoding (notably HEIC) is CPU-bound; the async path runs it in worker
+# processes so it neither holds the GIL nor blocks the event loop
+DECODE_MAX_WORKERS = 2
+_decode_pool: ProcessPoolExecutor | None = None
+
 
-client = create_anthropic_client()
+# A file whose bytes differ from a cached one (e.g. edited metadata) reuses its
+# features only if the decoded pixels are identical. Perceptual hashes within this
+# many of 64 bits only select candidates: near-duplicates such as another frame of
+# the same street can carry different text and must not share features.
+PERCEPTUAL_MATCH_MAX_DISTANCE = 6
+PERCEPTUAL_INDEX_SIZE = 1024
 
 
-def _run_claude_vision(image_data, media_type, prompt):
-    response = client.messages.create(
-        model="claude-opus-4-6",
-        max_tokens=1200,
+# Output budget per pass; the combined pass needs room for all three
+VISION_MAX_TOKENS = 1200
+
+
+def _vision_request(image_data, media_type, prompt, model, max_tokens=VISION_MAX_TOKENS):
+    return dict(
+        model=model,
+        max_tokens=max_tokens,
         temperature=0,
+        timeout=VISION_REQUEST_TIMEOUT_S,
         messages=[
             {
                 "role": "user",
@@ -32,7 +87,37 @@ def _run_claude_vision(image_data, media_type, prompt):
         ],
     )
 
-    raw = response.content[0].text
+
+def _run_claude_vision(image_data, media_type, prompt, model, max_tokens=VISION_MAX_TOKENS):
+    # Streamed so the response is read as it is generated rather than in one
+    # blocking body at the end
+    with client.messages.stream(
+        **_vision_request(image_data, media_type, prompt, model, max_tokens=max_tokens)
+    ) as stream:
+        raw = "".join(stream.text_stream)
+
+    return extract_json_from_response(raw)
+
+
+def _get_vision_resources() -> tuple[AsyncAnthropic, asyncio.Semaphore]:
+    """Return the async client and concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    resources = _loop_vision_resources.get(loop)
+    if resources is None:
+        resources = (create_async_anthropic_client(), asyncio.Semaphore(VISION_MAX_CONCURRENCY))
+        _loop_vision_resources[loop] = resources
+    return resources
+
+
+async def _run_claude_vision_async(
+    image_data, media_type, prompt, model, max_tokens=VISION_MAX_TOKENS
+):
+    async_client, vision_semaphore = _get_vision_resources()
+    async with vision_semaphore:
+        async with async_client.messages.stream(
+            **_vision_request(image_data, media_type, prompt, model, max_tokens=max_tokens)
+        ) as stream:
+            raw = "".join([text async for text in stream.text_stream])
 
     return extract_json_from_response(raw)
 
@@ -44,23 +129,41 @@ def image_to_geoguessr_features(image_base64, media_type="image/jpeg"):
 
     Returns structured JSON with hallucination control.
     """
+    if settings.vision_combined_pass:
+        return _combined_features(
+            _run_claude_vision(
+                image_base64,
+                media_type,
+                COMBINED_PASS_PROMPT,
+                settings.vision_text_model,
+                max_tokens=3 * VISION_MAX_TOKENS,
+            )
+        )
 
-    textual_features = _run_claude_vision(
-        image_base64,
-        media_type,
-        TEXT_PASS_PROMPT
+    # The passes are independent network round-trips, so run them side by side.
+    # Reading signs and text needs the stronger model; the feature passes don't.
+    textual_future = _VISION_POOL.submit(
+        _run_claude_vision, image_base64, media_type, TEXT_PASS_PROMPT, settings.vision_text_model
     )
-    infrastructure_features = _run_claude_vision(
+    infrastructure_future = _VISION_POOL.submit(
+        _run_claude_vision,
         image_base64,
         media_type,
-        ENV_INFRASTRUCTURE_PROMPT
+        ENV_INFRASTRUCTURE_PROMPT,
+        settings.vision_env_model,
     )
-    architecture_features = _run_claude_vision(
+    architecture_future = _VISION_POOL.submit(
+        _run_claude_vision,
         image_base64,
         media_type,
-        ENV_ARCHITECTURE_PROMPT
+        ENV_ARCHITECTURE_PROMPT,
+        settings.vision_env_model,
     )
 
+    textual_features = textual_future.result()
+    infrastructure_features = infrastructure_future.result()
+    architecture_features = architecture_future.result()
+
 
     result = {
         "textual_features": textual_features,
@@ -76,19 +179,171 @@ def image_to_geoguessr_features(image_base64, media_type="image/jpeg"):
     return result
 
 
+async def image_to_geoguessr_features_async(image_base64, media_type="image/jpeg"):
+    """Same as image_to_geoguessr_features, but runs the three passes concurrently."""
+    if settings.vision_combined_pass:
+        return _combined_features(
+            await _run_claude_vision_async(
+                image_base64,
+                media_type,
+                COMBINED_PASS_PROMPT,
+                settings.vision_text_model,
+                max_tokens=3 * VISION_MAX_TOKENS,
+            )
+        )
+
+    textual_features, infrastructure_features, architecture_features = await asyncio.gather(
+        _run_claude_vision_async(
+            image_base64, media_type, TEXT_PASS_PROMPT, settings.vision_text_model
+        ),
+        _run_claude_vision_async(
+            image_base64, media_type, ENV_INFRASTRUCTURE_PROMPT, settings.vision_env_model
+        ),
+        _run_claude_vision_async(
+            image_base64, media_type, ENV_ARCHITECTURE_PROMPT, settings.vision_env_model
+        ),
+    )
+
+    return {
+        "textual_features": textual_features,
+        "architecture_features": architecture_features,
+        "infrastructure_features": infrastructure_features,
+        "meta": {"extraction_warnings": []},
+    }
+
+
+def _combined_features(combined: dict) -> dict:
+    """Shape the combined pass response like the three-pass result."""
+    return {
+        "textual_features": combined.get("textual_features"),
+        "architecture_features": combined.get("architecture_features"),
+        "infrastructure_features": combined.get("infrastructure_features"),
+        "meta": {"extraction_warnings": []},
+    }
 
 
-def extract_json_description_and_metadata(path) -> tuple[dict, dict]:
+def _get_decode_pool() -> ProcessPoolExecutor:
+    global _decode_pool
+    if _decode_pool is None:
+        # spawn: forking a process that already runs threads is unsafe
+        _decode_pool = ProcessPoolExecutor(
+            max_workers=DECODE_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _decode_pool
+
+
+def _read_bytes(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@functools.cache
+def _get_features_cache() -> DiskCacheBackend:
+    """Return the features cache, creating settings.i2t_cache_dir on first use.
+
+    Features are keyed by image contents and prompt version, so re-running on the
+    same image skips the vision passes.
+    """
+    return DiskCacheBackend(settings.i2t_cache_dir)
+
+
+def _features_cache_version() -> str:
+    """Short digest of everything besides the image that shapes the extracted features."""
+    config = "|".join(
+        (
+            f"v{PROMPT_VERSION}",
+            settings.vision_text_model,
+            settings.vision_env_model,
+            f"combined={settings.vision_combined_pass}",
+        )
+    )
+    return hashlib.sha256(config.encode()).hexdigest()[:16]
+
+
+def _features_cache_key(image_bytes: bytes) -> str:
+    return f"{hashlib.sha256(image_bytes).hexdigest()}-{_features_cache_version()}"
+
+
+def _perceptual_index_key() -> str:
+    return f"perceptual-index-{_features_cache_version()}-pixels"
+
+
+def _get_cached_features(cache_key: str, perceptual_hash: int, digest: str) -> dict | None:
+    features_cache = _get_features_cache()
+    features = features_cache.get(cache_key)
+    if features is not None:
+        return features
+
+    # Fall back to a previously seen file with exactly the same pixels, found among
+    # the perceptually close candidates
+    for known_hash, known_key, known_digest in features_cache.get(_perceptual_index_key()) or []:
+        if (
+            hamming_distance(perceptual_hash, known_hash) <= PERCEPTUAL_MATCH_MAX_DISTANCE
+            and known_digest == digest
+        ):
+            return features_cache.get(known_key)
+    return None
+
+
+def _cache_features(cache_key: str, perceptual_hash: int, digest: str, features: dict) -> None:
+    features_cache = _get_features_cache()
+    features_cache.set(cache_key, features)
+
+    index = [
+        entry
+        for entry in features_cache.get(_perceptual_index_key()) or []
+        if entry[1] != cache_key
+    ]
+    index.append([perceptual_hash, cache_key, digest])
+    features_cache.set(_perceptual_index_key(), index[-PERCEPTUAL_INDEX_SIZE:])
+
+
+def extract_json_description_and_metadata(
+    path, image_bytes: bytes | None = None
+) -> tuple[dict, dict]:
     """
     Runs the full image to text pipeline and returns features along with the preprocessed image.
+
+    If the caller already holds the file contents, pass them as image_bytes to skip re-reading path.
+    Features are cached on disk by image contents, PROMPT_VERSION and the vision
+    settings, and reused for files that decode to exactly the same pixels.
     """
-    image_base64, metadata, img = preprocessing.preprocess_image(path)
+    if image_bytes is None:
+        image_bytes = _read_bytes(path)
 
-    features = image_to_geoguessr_features(
-        image_base64=image_base64,
-        media_type="image/jpeg"
-    )
+    image_base64, metadata, img = preprocessing.preprocess_image(path, image_bytes=image_bytes)
+
+    cache_key = _features_cache_key(image_bytes)
+    perceptual_hash = dhash(img)
+    digest = pixel_digest(img)
+    features = _get_cached_features(cache_key, perceptual_hash, digest)
+    if features is None:
+        features = image_to_geoguessr_features(
+            image_base64=image_base64,
+            media_type="image/jpeg"
+        )
+        _cache_features(cache_key, perceptual_hash, digest, features)
 
     return features, None, metadata
 
 
+async def extract_json_description_and_metadata_async(
+    path, image_bytes: bytes | None = None
+) -> tuple[dict, dict]:
+    """Async variant of extract_json_description_and_metadata with concurrent vision passes."""
+    if image_bytes is None:
+        image_bytes = await asyncio.to_thread(_read_bytes, path)
+
+    loop = asyncio.get_running_loop()
+    image_base64, metadata, perceptual_hash, digest = await loop.run_in_executor(
+        _get_decode_pool(), preprocessing.decode_for_agent, path, image_bytes
+    )
+
+    # The cache lives on disk, so lookups and writes stay off the event loop
+    cache_key = _features_cache_key(image_bytes)
+    features = await asyncio.to_thread(_get_cached_features, cache_key, perceptual_hash, digest)
+    if features is None:
+        features = await image_to_geoguessr_features_async(image_base64, media_type="image/jpeg")
+        await asyncio.to_thread(_cache_features, cache_key, perceptual_hash, digest, features)
+
+    return features, None, metadata
@@ -1,3 +1,7 @@
+import copy
+import functools
+import io
+import os
 from PIL import Image, ExifTags
 from pillow_heif import register_heif_opener
 from datetime import datetime
@@ -7,6 +11,10 @@ from typing import Any, Dict
 # Register HEIF opener once at module level to handle all HEIC/HEIF formats
 register_heif_opener()
 
+# Tags are looked up by number instead of renaming every tag of the IFD
+ExifTag = ExifTags.Base
+GPSTag = ExifTags.GPS
+
 
 
 
@@ -28,18 +36,14 @@ def normalize_exif(exif: Dict[int, Any]) -> Dict[str, Any]:
     
     device_data = 34665 in exif
     geo_data = 34853 in exif
-    
-    if device_data:
-        exif_offset_named = gps_named = {ExifTags.TAGS.get(k, k): v for k, v in exif[34665].items()}
-    if geo_data:
-        gps_named = {ExifTags.GPSTAGS.get(k, k): v for k, v in exif[34853].items()}
 
     if geo_data:
+        gps_ifd = exif[34853]
         gps = {}
-        lat = gps_named.get("GPSLatitude")
-        lat_ref = gps_named.get("GPSLatitudeRef")
-        lon = gps_named.get("GPSLongitude")
-        lon_ref = gps_named.get("GPSLongitudeRef")
+        lat = gps_ifd.get(GPSTag.GPSLatitude)
+        lat_ref = gps_ifd.get(GPSTag.GPSLatitudeRef)
+        lon = gps_ifd.get(GPSTag.GPSLongitude)
+        lon_ref = gps_ifd.get(GPSTag.GPSLongitudeRef)
 
         if lat and lat_ref:
             gps["latitude"] = dms_to_decimal(lat, lat_ref)
@@ -47,50 +51,50 @@ def normalize_exif(exif: Dict[int, Any]) -> Dict[str, Any]:
         if lon and lon_ref:
             gps["longitude"] = dms_to_decimal(lon, lon_ref)
 
-        if "GPSAltitude" in gps_named:
-            gps["altitude_m"] = float(gps_named["GPSAltitude"])
+        if GPSTag.GPSAltitude in gps_ifd:
+            gps["altitude_m"] = float(gps_ifd[GPSTag.GPSAltitude])
 
-        if "GPSSpeed" in gps_named:
-            gps["speed"] = float(gps_named["GPSSpeed"])
+        if GPSTag.GPSSpeed in gps_ifd:
+            gps["speed"] = float(gps_ifd[GPSTag.GPSSpeed])
 
-        if "GPSTrack" in gps_named:
-            gps["track_deg"] = gps_named["GPSTrack"]
+        if GPSTag.GPSTrack in gps_ifd:
+            gps["track_deg"] = gps_ifd[GPSTag.GPSTrack]
 
-        if "GPSDateStamp" in gps_named:
-            gps["date"] = gps_named["GPSDateStamp"]
+        if GPSTag.GPSDateStamp in gps_ifd:
+            gps["date"] = gps_ifd[GPSTag.GPSDateStamp]
     else:
         gps = {} #macaroni code =)
 
     if device_data:
+        exif_ifd = exif[34665]
         device = {
             "device": {
-            "manufacturer": exif_offset_named.get("Make"),
-            "model": exif_offset_named.get("Model"),
-            "software": exif_offset_named.get("Software"),
-            "lens": exif_offset_named.get("LensModel"),
+            "manufacturer": exif_ifd.get(ExifTag.Make),
+            "model": exif_ifd.get(ExifTag.Model),
+            "software": exif_ifd.get(ExifTag.Software),
+            "lens": exif_ifd.get(ExifTag.LensModel),
             },
             "capture": {
-                "datetime_original":
-                    exif_offset_named.get("DateTimeOriginal") if exif_offset_named.get("DateTimeOriginal") else None,
-                "datetime_digitized": exif_offset_named.get("DateTimeDigitized") if exif_offset_named.get("DateTimeDigitized") else None,
+                "datetime_original": exif_ifd.get(ExifTag.DateTimeOriginal) or None,
+                "datetime_digitized": exif_ifd.get(ExifTag.DateTimeDigitized) or None,
             },
             "camera": {
-                "f_number": str(exif_offset_named.get("FNumber")),
-                "exposure_time_s": str(exif_offset_named.get("ExposureTime")),
-                "iso": str(exif_offset_named.get("ISOSpeedRatings")),
-                "focal_length_mm": str(exif_offset_named.get("FocalLength")),
-                "exposure_bias": str(exif_offset_named.get("ExposureBiasValue")),
+                "f_number": str(exif_ifd.get(ExifTag.FNumber)),
+                "exposure_time_s": str(exif_ifd.get(ExifTag.ExposureTime)),
+                "iso": str(exif_ifd.get(ExifTag.ISOSpeedRatings)),
+                "focal_length_mm": str(exif_ifd.get(ExifTag.FocalLength)),
+                "exposure_bias": str(exif_ifd.get(ExifTag.ExposureBiasValue)),
             },
             "image": {
-                "width": exif_offset_named.get("ExifImageWidth"),
-                "height": exif_offset_named.get("ExifImageHeight"),
-                "orientation": exif_offset_named.get("Orientation"),
-                "x_resolution": str(exif_offset_named.get("XResolution")),
-                "y_resolution": str(exif_offset_named.get("YResolution")),
+                "width": exif_ifd.get(ExifTag.ExifImageWidth),
+                "height": exif_ifd.get(ExifTag.ExifImageHeight),
+                "orientation": exif_ifd.get(ExifTag.Orientation),
+                "x_resolution": str(exif_ifd.get(ExifTag.XResolution)),
+                "y_resolution": str(exif_ifd.get(ExifTag.YResolution)),
             }
         }
     else:
-        device_data = {}
+        device = {}
     
     result = device | gps
 
@@ -103,29 +107,55 @@ def normalize_exif(exif: Dict[int, Any]) -> Dict[str, Any]:
     return clean(result)
 
 
-def extract_image_metadata_for_agent(image_path: str) -> Dict[str, Any]:
+def extract_image_metadata_for_agent(
+    image_path: str, image_bytes: bytes | None = None
+) -> dict[str, Any]:
     """Extract metadata from any image file format.
 
     Supports JPEG, PNG, HEIC, HEIF, and other formats supported by PIL.
     Metadata extraction works for formats that contain EXIF data.
+    Results for files on disk are memoized by path, modification time and size.
 
     Args:
         image_path: Path to the image file
+        image_bytes: Optional contents of the file, used instead of reading image_path
 
     Returns:
         Dictionary containing image metadata and agent notes, or empty dict if no metadata
     """
+    if image_bytes is not None:
+        return _read_metadata(image_path, image_bytes)
+
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return _read_metadata(image_path)
+
+    # Callers get their own copy so they can't modify the cached entry
+    return copy.deepcopy(_cached_metadata(image_path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_metadata(image_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns and size only take part in the cache key, so an edited file is re-read
+    return _read_metadata(image_path)
+
+
+def _read_metadata(image_path: str, image_bytes: bytes | None = None) -> dict[str, Any]:
     exif_keys = [34853, 34665]  # GPS and EXIF IFD keys
 
     try:
-        img = Image.open(image_path)
+        source = io.BytesIO(image_bytes) if image_bytes is not None else image_path
 
+        # Only the EXIF block is read; pixel data is never decoded. The context
+        # manager closes the file instead of leaving it to garbage collection.
         raw = {}
-        img_exif = img.getexif()
-        for key in exif_keys:
-            exifcode = img_exif.get_ifd(key)
-            if exifcode:
-                raw[key] = exifcode
+        with Image.open(source) as img:
+            img_exif = img.getexif()
+            for key in exif_keys:
+                exifcode = img_exif.get_ifd(key)
+                if exifcode:
+                    raw[key] = exifcode
 
         normalized = normalize_exif(raw)
 
@@ -1,13 +1,20 @@
 import base64
-from PIL import Image, ImageEnhance
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pillow_heif
+from PIL import Image
 from app.tools.image_to_text.metadata import extract_image_metadata_for_agent
+from app.utils.image_hash import dhash, pixel_digest
 
-def load_image_as_base64(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
-    
 
-def resize_longest_side(img, target=1024):
+# Longest side of the image sent to the vision model
+TARGET_LONGEST_SIDE = 1024
+
+
+def resize_longest_side(img, target=TARGET_LONGEST_SIDE, resample=Image.Resampling.BILINEAR):
+    # BILINEAR rather than LANCZOS: the vision model rescales the image again, so the
+    # sharper filter buys nothing and costs several times more
     w, h = img.size
     scale = target / max(w, h)
 
@@ -15,9 +22,50 @@ def resize_longest_side(img, target=1024):
         return img
 
     new_size = (int(w * scale), int(h * scale))
-    return img.resize(new_size, Image.LANCZOS)
+    return img.resize(new_size, resample)
+
+def open_heif_preview(source, min_side=TARGET_LONGEST_SIDE):
+    """Decode the smallest embedded HEIF thumbnail whose longest side is at least min_side.
+
+    Phone HEICs are 12MP+ HEVC frames that take hundreds of milliseconds to decode
+    only to be resized to TARGET_LONGEST_SIDE; a large enough embedded preview gives
+    the same result for a fraction of the cost.
+
+    Returns:
+        RGB PIL image, or None if the file has no thumbnail that large
+    """
+    heif_file = pillow_heif.open_heif(source)
+    primary = heif_file[heif_file.primary_index]
+    boxes = primary.info.get("thumbnails") or []
+    candidates = [(box, index) for index, box in enumerate(boxes) if box >= min_side]
+    if not candidates:
+        return None
+
+    _, index = min(candidates)
+    return primary.get_thumbnail(index).to_pillow()
+
 
-def preprocess_image(path):
+def adjust_contrast(img, factor):
+    """Match ImageEnhance.Contrast(img).enhance(factor) on RGB images, within one level.
+
+    Applies a 256-entry lookup table in a single pass instead of building a gray
+    image of the same size and blending against it. The gray level is derived from
+    the channel histograms (ITU-R 601-2 luma), as Contrast does via an L conversion.
+    """
+    histogram = img.histogram()
+    pixel_count = img.width * img.height
+    channel_means = [
+        sum(value * count for value, count in enumerate(histogram[band * 256 : (band + 1) * 256]))
+        / pixel_count
+        for band in range(3)
+    ]
+    mean = int(0.299 * channel_means[0] + 0.587 * channel_means[1] + 0.114 * channel_means[2] + 0.5)
+
+    lut = [max(0, min(255, int(mean + (value - mean) * factor))) for value in range(256)]
+    return img.point(lut * 3)
+
+
+def preprocess_image(path, image_bytes=None):
     """Preprocess any image format for agent processing.
 
     Extracts metadata first (works with original HEIC/HEIF files),
@@ -25,32 +73,76 @@ def preprocess_image(path):
 
     Args:
         path: Path to the image file (supports JPEG, PNG, HEIC, HEIF, etc.)
+        image_bytes: Optional contents of the file at path, used instead of reading it again
 
     Returns:
         Tuple of (base64_string, metadata_dict, PIL_Image)
     """
     # Extract metadata before conversion (works with HEIC and all formats)
-    metadata = extract_image_metadata_for_agent(path)
+    metadata = extract_image_metadata_for_agent(path, image_bytes=image_bytes)
 
     # Open and convert image to RGB for agent processing
-    img = Image.open(path)
+    img = Image.open(io.BytesIO(image_bytes) if image_bytes is not None else path)
+    if img.format == "HEIF":
+        preview = open_heif_preview(io.BytesIO(image_bytes) if image_bytes is not None else path)
+        if preview is not None:
+            img = preview
+
+    # Let JPEG decoding downscale in the DCT domain (1/2, 1/4, 1/8) while keeping
+    # both sides at least TARGET_LONGEST_SIDE; no-op for other formats
+    img.draft("RGB", (TARGET_LONGEST_SIDE, TARGET_LONGEST_SIDE))
 
     # Convert to RGB first (handles RGBA, P, L, CMYK, etc.)
     if img.mode != "RGB":
         img = img.convert("RGB")
 
-    # Apply enhancement
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(1.1)
-
-    # Resize if needed
+    # Resize if needed, before enhancing so the contrast pass touches fewer pixels
     img = resize_longest_side(img)
 
-    # Save as JPEG for agent compatibility
-    img.save((final_path := "app/images/preprocessed_image.jpg"), quality=95)
-    base64_str = load_image_as_base64(final_path)
+    # Apply enhancement
+    img = adjust_contrast(img, 1.1)
+
+    # Encode as JPEG in memory for agent compatibility
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=95)
+    base64_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
 
     return base64_str, metadata, img
 
+
+def preprocess_images(paths, max_workers=None):
+    """Run preprocess_image on several files concurrently.
+
+    Threads are enough here: PIL releases the GIL while decoding, resizing and
+    encoding, which is where nearly all of the time goes.
+
+    Args:
+        paths: Image file paths
+        max_workers: Worker threads; defaults to the CPU count, capped at len(paths)
+
+    Returns:
+        List of preprocess_image results, in the order of paths
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [preprocess_image(path) for path in paths]
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(preprocess_image, paths))
+
+
+def decode_for_agent(path, image_bytes=None):
+    """Run preprocess_image and return only the picklable parts.
+
+    Used as a process pool task, so the PIL image is not sent back to the caller;
+    its perceptual hash and pixel digest are computed here instead.
+
+    Returns:
+        Tuple of (base64_string, metadata_dict, perceptual_hash, pixel_digest)
+    """
+    base64_str, metadata, img = preprocess_image(path, image_bytes=image_bytes)
+    return base64_str, metadata, dhash(img), pixel_digest(img)
+
 if __name__ == "__main__":
     print(preprocess_image("app/images/col.HEIC")[1])
\ No newline at end of file
@@ -12,6 +12,51 @@ class MainDBTool(BaseTool):
     Database modifications are handled by validator or user outside this tool.
     """
 
+    name = "maindb"
+    description = (
+        "Interact with the investigation database. Supports operations: "
+        "'get_state' (retrieve investigation state, including initial textual "
+        "description from image to text, metadata, wrongs, context, and validated "
+        "searches), 'get_field' (retrieve specific field), 'to_dict' (get full "
+        "database as dictionary), 'add_validated_search' (store search results to "
+        "prevent repeated searches - requires 'query' and 'results' fields), "
+        "'check_progress' (check if investigation is making progress based on "
+        "summary redundancy - returns whether to continue investigating)."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": [
+                    "get_state",
+                    "get_field",
+                    "to_dict",
+                    "add_validated_search",
+                    "check_progress",
+                ],
+                "description": "The database operation to perform",
+            },
+            "field": {
+                "type": "string",
+                "description": (
+                    "Field name for get_field action (e.g., 'initial_text', 'wrongs', "
+                    "'context', 'metadata', 'initial_photo', "
+                    "'history_of_validated_searches')"
+                ),
+            },
+            "query": {
+                "type": "string",
+                "description": "Search query string for add_validated_search action",
+            },
+            "results": {
+                "type": "string",
+                "description": "Search results summary for add_validated_search action",
+            },
+        },
+        "required": ["action"],
+    }
+
     def __init__(self, db: InvestigationDB):
         """Initialize the MainDB tool with a database instance.
 
@@ -19,60 +64,21 @@ class MainDBTool(BaseTool):
             db: The InvestigationDB instance to interact with.
         """
         self.db = db
-
-    def get_name(self) -> str:
-        """Returns the tool name."""
-        return "maindb"
-
-    def get_description(self) -> str:
-        """Returns what the tool does."""
-        return (
-            "Interact with the investigation database. Supports operations: "
-            "'get_state' (retrieve investigation state, including initial textual "
-            "description from image to text, metadata, wrongs, context, and validated "
-            "searches), 'get_field' (retrieve specific field), 'to_dict' (get full "
-            "database as dictionary), 'add_validated_search' (store search results to "
-            "prevent repeated searches - requires 'query' and 'results' fields), "
-            "'check_progress' (check if investigation is making progress based on "
-            "summary redundancy - returns whether to continue investigating)."
-        )
-
-    def get_parameters(self) -> dict[str, Any]:
-        """Returns the parameter schema for the tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": [
-                        "get_state",
-                        "get_field",
-                        "to_dict",
-                        "add_validated_search",
-                        "check_progress",
-                    ],
-                    "description": "The database operation to perform",
-                },
-                "field": {
-                    "type": "string",
-                    "description": (
-                        "Field name for get_field action (e.g., 'initial_text', 'wrongs', "
-                        "'context', 'metadata', 'initial_photo', "
-                        "'history_of_validated_searches')"
-                    ),
-                },
-                "query": {
-                    "type": "string",
-                    "description": "Search query string for add_validated_search action",
-                },
-                "results": {
-                    "type": "string",
-                    "description": "Search results summary for add_validated_search action",
-                },
-            },
-            "required": ["action"],
+        self.invalidate_fields()
+        self._dispatch = {
+            "get_state": self._get_state,
+            "get_field": self._get_field,
+            "to_dict": self._to_dict,
+            "add_validated_search": self._add_validated_search,
+            "check_progress": self._check_progress,
         }
 
+    def invalidate_fields(self) -> None:
+        """Re-read the database's field names after its schema changes."""
+        field_names = self.db.keys()
+        self._valid_fields = frozenset(field_names)
+        self._valid_fields_str = ", ".join(field_names)
+
     def execute(self, **kwargs) -> ToolResult:
         """Executes the database operation with given parameters.
 
@@ -89,128 +95,8 @@ class MainDBTool(BaseTool):
         action = kwargs.get("action")
 
         try:
-            if action == "get_state":
-                initial_text, metadata, wrongs, context, validated_searches = (
-                    self.db.get_state_snapshot()
-                )
-                return ToolResult(
-                    success=True,
-                    data={
-                        "initial_text": initial_text,
-                        "metadata": metadata,
-                        "wrongs": wrongs,
-                        "context": context,
-                        "validated_searches": validated_searches,
-                    },
-                    metadata={"action": "get_state"},
-                )
-
-            elif action == "get_field":
-                field = kwargs.get("field")
-                if not field:
-                    return ToolResult(
-                        success=False,
-                        error="'field' parameter is required for get_field action",
-                    )
-
-                valid_fields = self.db.keys()
-                if field not in valid_fields:
-                    return ToolResult(
-                        success=False,
-                        error=f"Unknown field '{field}'. Valid fields: {', '.join(valid_fields)}",
-                    )
-
-                value = self.db.get(field)
-                return ToolResult(
-                    success=True,
-                    data={field: value},
-                    metadata={"action": "get_field", "field": field},
-                )
-
-            elif action == "to_dict":
-                return ToolResult(
-                    success=True,
-                    data=self.db.to_dict(),
-                    metadata={"action": "to_dict"},
-                )
-
-            elif action == "add_validated_search":
-                query = kwargs.get("query")
-                results = kwargs.get("results")
-
-                if not query:
-                    return ToolResult(
-                        success=False,
-                        error="'query' parameter is required for add_validated_search action",
-                    )
-                if not results:
-                    return ToolResult(
-                        success=False,
-                        error="'results' parameter is required for add_validated_search action",
-                    )
-
-                search_entry = {
-                    "query": query,
-                    "results": results,
-                }
-                self.db.add_validated_search(search_entry)
-
-                return ToolResult(
-                    success=True,
-                    data={"message": "Search result stored successfully", "query": query},
-                    metadata={"action": "add_validated_search", "query": query},
-                )
-
-            elif action == "check_progress":
-                # Check if investigation should continue based on summary redundancy
-                summaries = self.db.get_summaries()
-
-                if not summaries:
-                    return ToolResult(
-                        success=True,
-                        data={
-                            "should_continue": True,
-                            "reason": "No summaries yet - investigation just started",
-                            "total_summaries": 0,
-                        },
-                        metadata={"action": "check_progress"},
-                    )
-
-                # Get most recent summary
-                latest_summary = summaries[-1]
-                is_redundant = latest_summary.get("is_redundant", False)
-                similarity_score = latest_summary.get("similarity_score", 0.0)
-
-                if is_redundant:
-                    return ToolResult(
-                        success=True,
-                        data={
-                            "should_continue": False,
-                            "reason": (
-                                f"Investigation has converged - latest findings are "
-                                f"redundant (similarity: {similarity_score:.2f})"
-                            ),
-                            "total_summaries": len(summaries),
-                            "similarity_score": similarity_score,
-                        },
-                        metadata={"action": "check_progress"},
-                    )
-                else:
-                    return ToolResult(
-                        success=True,
-                        data={
-                            "should_continue": True,
-                            "reason": (
-                                f"Investigation making progress - findings show "
-                                f"new information (similarity: {similarity_score:.2f})"
-                            ),
-                            "total_summaries": len(summaries),
-                            "similarity_score": similarity_score,
-                        },
-                        metadata={"action": "check_progress"},
-                    )
-
-            else:
+            handler = self._dispatch.get(action)
+            if handler is None:
                 return ToolResult(
                     success=False,
                     error=(
@@ -218,10 +104,129 @@ class MainDBTool(BaseTool):
                         "get_field, to_dict, add_validated_search, check_progress"
                     ),
                 )
-
+            return handler(**kwargs)
         except Exception as e:
             return ToolResult(
                 success=False,
                 error=f"Database operation failed: {str(e)}",
                 metadata={"action": action, "exception_type": type(e).__name__},
             )
+
+    # Handlers take the arguments they use by name; the rest of the tool call
+    # (including "action") is absorbed by **_
+
+    def _get_state(self, **_: Any) -> ToolResult:
+        initial_text, metadata, wrongs, context, validated_searches = self.db.get_state_snapshot()
+        return ToolResult(
+            success=True,
+            data={
+                "initial_text": initial_text,
+                "metadata": metadata,
+                "wrongs": wrongs,
+                "context": context,
+                "validated_searches": validated_searches,
+            },
+            metadata={"action": "get_state"},
+        )
+
+    def _get_field(self, field: str | None = None, **_: Any) -> ToolResult:
+        if not field:
+            return ToolResult(
+                success=False,
+                error="'field' parameter is required for get_field action",
+            )
+
+        if field not in self._valid_fields:
+            return ToolResult(
+                success=False,
+                error=f"Unknown field '{field}'. Valid fields: {self._valid_fields_str}",
+            )
+
+        value = self.db.get(field)
+        return ToolResult(
+            success=True,
+            data={field: value},
+            metadata={"action": "get_field", "field": field},
+        )
+
+    def _to_dict(self, **_: Any) -> ToolResult:
+        return ToolResult(
+            success=True,
+            data=self.db.to_dict(),
+            metadata={"action": "to_dict"},
+        )
+
+    def _add_validated_search(
+        self, query: str | None = None, results: str | None = None, **_: Any
+    ) -> ToolResult:
+        if not query:
+            return ToolResult(
+                success=False,
+                error="'query' parameter is required for add_validated_search action",
+            )
+        if not results:
+            return ToolResult(
+                success=False,
+                error="'results' parameter is required for add_validated_search action",
+            )
+
+        search_entry = {
+            "query": query,
+            "results": results,
+        }
+        self.db.add_validated_search(search_entry)
+
+        return ToolResult(
+            success=True,
+            data={"message": "Search result stored successfully", "query": query},
+            metadata={"action": "add_validated_search", "query": query},
+        )
+
+    def _check_progress(self, **_: Any) -> ToolResult:
+        # Check if investigation should continue based on summary redundancy
+        summaries = self.db.get_summaries()
+
+        if not summaries:
+            return ToolResult(
+                success=True,
+                data={
+                    "should_continue": True,
+                    "reason": "No summaries yet - investigation just started",
+                    "total_summaries": 0,
+                },
+                metadata={"action": "check_progress"},
+            )
+
+        # Get most recent summary
+        latest_summary = summaries[-1]
+        is_redundant = latest_summary.get("is_redundant", False)
+        similarity_score = latest_summary.get("similarity_score", 0.0)
+
+        if is_redundant:
+            return ToolResult(
+                success=True,
+                data={
+                    "should_continue": False,
+                    "reason": (
+                        f"Investigation has converged - latest findings are "
+                        f"redundant (similarity: {similarity_score:.2f})"
+                    ),
+                    "total_summaries": len(summaries),
+                    "similarity_score": similarity_score,
+                },
+                metadata={"action": "check_progress"},
+            )
+        else:
+            return ToolResult(
+                success=True,
+                data={
+                    "should_continue": True,
+                    "reason": (
+                        f"Investigation making progress - findings show "
+                        f"new information (similarity: {similarity_score:.2f})"
+                    ),
+                    "total_summaries": len(summaries),
+                    "similarity_score": similarity_score,
+                },
+                metadata={"action": "check_progress"},
+            )
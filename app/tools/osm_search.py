@@ -1,53 +1,64 @@
-import requests
-from typing import Any
+import functools
 from .base_tool import BaseTool, ToolResult
+from app.utils.http import DEFAULT_TIMEOUT, create_http_session
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+
+# Distinct queries whose formatted results are kept in memory
+OSM_CACHE_SIZE = 256
+
+# Reused across calls so repeat lookups skip the DNS, TCP and TLS setup
+_SESSION = create_http_session()
 
 class OSMLookupTool(BaseTool):
     """
     Tool to query OpenStreetMap (Nominatim).
     """
 
-    def get_name(self) -> str:
-        return "lookup_location"
-
-    def get_description(self) -> str:
-        return "Get coordinates and address details for a location name. Use this to verify if a landmark exists in a specific city."
-
-    def get_parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The location name, address, or landmark to look up (e.g. 'Eiffel Tower', 'Baker Street, London')"
-                }
-            },
-            "required": ["query"]
-        }
+    name = "lookup_location"
+    description = (
+        "Get coordinates and address details for a location name. "
+        "Use this to verify if a landmark exists in a specific city."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": (
+                    "The location name, address, or landmark to look up "
+                    "(e.g. 'Eiffel Tower', 'Baker Street, London')"
+                )
+            }
+        },
+        "required": ["query"]
+    }
 
     def execute(self, **kwargs) -> ToolResult:
         query = kwargs.get("query")
-        url = "https://nominatim.openstreetmap.org/search"
-        # Nominatim requires a unique User-Agent
-        headers = {'User-Agent': 'O-Agent-GeoDetective/1.0'}
-        params = {'q': query, 'format': 'json', 'limit': 3}
-        
         try:
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data:
-                return ToolResult(success=True, data="No location found in OpenStreetMap database.")
-            
-            results = []
-            for item in data:
-                name = item.get('display_name', 'Unknown')
-                lat = item.get('lat')
-                lon = item.get('lon')
-                type_ = item.get('type', 'location')
-                results.append(f"Found: {name}\nCoordinates: {lat}, {lon} ({type_})")
-                
-            return ToolResult(success=True, data="\n---\n".join(results))
+            return ToolResult(success=True, data=_osm_fetch(query))
         except Exception as e:
-            return ToolResult(success=False, error=str(e))
\ No newline at end of file
+            return ToolResult(success=False, error=str(e))
+
+
+@functools.lru_cache(maxsize=OSM_CACHE_SIZE)
+def _osm_fetch(query: str) -> str:
+    """Look up a query in Nominatim and format the matches.
+
+    Failures raise and are therefore not cached.
+    """
+    params = {'q': query, 'format': 'json', 'limit': 3}
+    response = _SESSION.get(NOMINATIM_URL, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+
+    if not data:
+        return "No location found in OpenStreetMap database."
+
+    # Nominatim always includes display_name, lat and lon in search results
+    return "\n---\n".join(
+        f"Found: {item['display_name']}\n"
+        f"Coordinates: {item['lat']}, {item['lon']} ({item.get('type', 'location')})"
+        for item in data
+    )
@@ -1,18 +1,59 @@
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from app.tools.base_tool import BaseTool
 
 
-def create_tool_schema(tool: BaseTool) -> dict[str, Any]:
+def _freeze(value: Any) -> Any:
+    """Read-only deep copy of a JSON-like value (dicts become mapping proxies, lists tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.cache
+def _class_tool_schema(cls: type[BaseTool]) -> Mapping[str, Any]:
+    """Schema of a tool class that describes itself through class attributes.
+
+    Shared by every agent using the class, so it is frozen against accidental edits.
+    """
+    return _freeze(
+        {
+            "name": cls.name,
+            "description": cls.description,
+            "input_schema": cls.parameters,
+        }
+    )
+
+
+def _uses_class_attributes(cls: type[BaseTool]) -> bool:
+    return (
+        cls.get_name is BaseTool.get_name
+        and cls.get_description is BaseTool.get_description
+        and cls.get_parameters is BaseTool.get_parameters
+    )
+
+
+def create_tool_schema(tool: BaseTool) -> Mapping[str, Any]:
     """
     Converts a tool into Claude's expected schema format.
 
+    The schema of a tool defined by class attributes is built once per class and
+    shared; tools overriding the getters (e.g. wrappers) are described per instance.
+
     Args:
         tool: The tool instance to convert
 
     Returns:
         A dictionary matching Claude's tool schema specification
     """
+    if _uses_class_attributes(type(tool)):
+        return _class_tool_schema(type(tool))
+
     return {
         "name": tool.get_name(),
         "description": tool.get_description(),
@@ -20,7 +61,7 @@ def create_tool_schema(tool: BaseTool) -> dict[str, Any]:
     }
 
 
-def register_tools(tools: list[BaseTool]) -> tuple[list[dict], dict[str, BaseTool]]:
+def register_tools(tools: list[BaseTool]) -> tuple[list[Mapping], dict[str, BaseTool]]:
     """
     Registers multiple tools and creates lookup structures.
 
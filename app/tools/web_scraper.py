@@ -1,42 +1,64 @@
-import trafilatura
-from typing import Any
 from .base_tool import BaseTool, ToolResult
+from app.utils.cache import MemoryCacheBackend
+from app.utils.http import DEFAULT_TIMEOUT, create_http_session
+
+# Maximum characters of extracted text returned to the agent
+MAX_TEXT_CHARS = 50000
+
+# HTML beyond this many bytes is not parsed; larger pages rarely yield more than
+# MAX_TEXT_CHARS of main text, while parse time grows with the document
+MAX_HTML_BYTES = 500_000
+
+# Reused across calls so pages from the same site share a connection
+_SESSION = create_http_session()
+
+# Extracted (already truncated) page text by URL; raw HTML is never kept
+_PAGE_CACHE = MemoryCacheBackend(max_entries=128, ttl=3600)
 
 class WebScraperTool(BaseTool):
     """
     Tool to extract main text from a URL.
     """
 
-    def get_name(self) -> str:
-        return "fetch_page"
-
-    def get_description(self) -> str:
-        return "Extract text content from a specific URL. Use this to read news articles or website 'About' pages to verify a location."
-
-    def get_parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "The URL to scrape (must start with http/https)"
-                }
-            },
-            "required": ["url"]
-        }
+    name = "fetch_page"
+    description = (
+        "Extract text content from a specific URL. Use this to read news articles "
+        "or website 'About' pages to verify a location."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "The URL to scrape (must start with http/https)"
+            }
+        },
+        "required": ["url"]
+    }
 
     def execute(self, **kwargs) -> ToolResult:
         url = kwargs.get("url")
+        cached = _PAGE_CACHE.get(url) if isinstance(url, str) else None
+        if cached is not None:
+            return ToolResult(success=True, data=cached)
+
         try:
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded is None:
+            # Imported on first use: trafilatura pulls in lxml and friends, which
+            # slows startup for runs that never fetch a page
+            import trafilatura
+
+            response = _SESSION.get(url, timeout=DEFAULT_TIMEOUT)
+            if response.status_code != 200 or not response.content:
                 return ToolResult(success=False, error="Could not retrieve page (bot protection or invalid URL).")
+            downloaded = response.content[:MAX_HTML_BYTES]
             
             text = trafilatura.extract(downloaded, include_comments=False, include_tables=True)
             if not text:
                 return ToolResult(success=False, error="Page retrieved but no main text content found.")
             
             # Truncate to prevent context overflow
-            return ToolResult(success=True, data=text[:50000])
+            text = text[:MAX_TEXT_CHARS]
+            _PAGE_CACHE.set(url, text)
+            return ToolResult(success=True, data=text)
         except Exception as e:
             return ToolResult(success=False, error=str(e))
\ No newline at end of file
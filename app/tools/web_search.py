@@ -1,44 +1,62 @@
-from typing import Any
-from ddgs import DDGS
+import threading
+from typing import TYPE_CHECKING
 from .base_tool import BaseTool, ToolResult
 
+if TYPE_CHECKING:
+    from ddgs import DDGS
+
+# One long-lived DDGS client per thread: it keeps its search engines and their HTTP
+# connections between calls, and concurrent tool calls don't contend on a lock
+_local = threading.local()
+
+
+def _get_ddgs() -> "DDGS":
+    ddgs = getattr(_local, "ddgs", None)
+    if ddgs is None:
+        # Imported on first use so startup doesn't pay for it
+        from ddgs import DDGS
+
+        ddgs = _local.ddgs = DDGS()
+    return ddgs
+
+
 class WebSearchTool(BaseTool):
     """
     Tool to search the web using DuckDuckGo.
     """
     
-    def get_name(self) -> str:
-        return "web_search"
-
-    def get_description(self) -> str:
-        return "Search the web for information. Use this to find addresses of businesses, cross-reference landmarks, or look up text found in images."
-
-    def get_parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query (e.g., 'storefront matching [text]', 'landmark with blue dome in [city]')"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Number of results to return (default: 5)"
-                }
+    name = "web_search"
+    description = (
+        "Search the web for information. Use this to find addresses of businesses, "
+        "cross-reference landmarks, or look up text found in images."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": (
+                    "The search query (e.g., 'storefront matching [text]', "
+                    "'landmark with blue dome in [city]')"
+                )
             },
-            "required": ["query"]
-        }
+            "max_results": {
+                "type": "integer",
+                "description": "Number of results to return (default: 5)"
+            }
+        },
+        "required": ["query"]
+    }
 
     def execute(self, **kwargs) -> ToolResult:
         query = kwargs.get("query")
         max_results = kwargs.get("max_results", 5)
         
         try:
-            results = []
-            with DDGS() as ddgs:
-                search_gen = ddgs.text(query, max_results=max_results)
-                for r in search_gen:
-                    results.append(f"Title: {r['title']}\nLink: {r['href']}\nSnippet: {r['body']}")
+            results = [
+                f"Title: {r['title']}\nLink: {r['href']}\nSnippet: {r['body']}"
+                for r in _get_ddgs().text(query, max_results=max_results)
+            ]
             
             if not results:
                 return ToolResult(success=True, data="No results found.")
@@ -0,0 +1,145 @@
+"""Key-value cache backends with TTL and LRU eviction."""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage for JSON-serializable values keyed by string."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, optionally overriding the backend's default TTL (seconds)."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry expiry. Safe to share between threads."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None):
+        """Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of entries before least recently used are evicted.
+            ttl: Default time-to-live in seconds, or None for no expiry.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and time.time() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+class DiskCacheBackend:
+    """On-disk cache storing one JSON file per entry.
+
+    Recency is tracked through file modification times, so the cache survives
+    restarts and can be shared by several processes.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = 1024, ttl: float | None = None):
+        """Initialize disk cache.
+
+        Args:
+            directory: Directory holding the cache files (created if missing).
+            max_entries: Maximum number of files before least recently used are evicted.
+            ttl: Default time-to-live in seconds, or None for no expiry.
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Dropping unreadable cache entry %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() > expires_at:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used
+        os.utime(path)
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        entry = {
+            "expires_at": time.time() + ttl if ttl is not None else None,
+            "value": value,
+        }
+
+        # Write to a temporary file first so readers never see a partial entry
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        files = list(self.directory.glob("*.json"))
+        if len(files) <= self.max_entries:
+            return
+
+        def mtime(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        files.sort(key=mtime)
+        for path in files[: len(files) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -1,36 +1,81 @@
-
 import json
 import re
 from typing import Any, Dict
 import logging
 logger = logging.getLogger(__name__)
 
+# Characters that affect brace matching: braces, and quotes/escapes for strings
+_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+def _find_json_span(text: str, start: int) -> int:
+        """Find the end of the balanced {...} block opening at text[start].
+
+        Braces inside JSON strings are ignored. Only the structural characters are
+        visited, so the scan is linear in the length of the text.
+
+        Returns:
+            Index just past the closing brace, or -1 if the block is never closed.
+        """
+        depth = 0
+        in_string = False
+        skip_to = -1
+        for match in _STRUCTURE_RE.finditer(text, start):
+            pos = match.start()
+            if pos < skip_to:
+                continue
+
+            char = text[pos]
+            if in_string:
+                if char == "\\":
+                    skip_to = pos + 2
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+        return -1
+
 def extract_json_from_response(response_text: str) -> Dict[str, Any]:
         """Extract JSON object from Claude's response text.
 
+        Returns the first balanced {...} block that parses as a JSON object, so
+        braces in surrounding prose or code fences are skipped rather than
+        merged into one oversized match.
+
         Args:
             response_text: Raw response text from Claude.
 
         Returns:
             Parsed JSON dict.
         """
-        # Try to find JSON object in the response
-        # Look for content between triple backticks first
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            # Try to find a JSON object directly
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
+        first_error = None
+        start = response_text.find("{")
+        while start != -1:
+            end = _find_json_span(response_text, start)
+            if end == -1:
+                break
+
+            json_str = response_text[start:end]
+            try:
+                parsed = json.loads(json_str)
+            except json.JSONDecodeError as e:
+                first_error = first_error or (e, json_str)
             else:
-                logger.error("Could not find JSON in response: %s", response_text[:200])
-                raise ValueError("No JSON found in response")
-
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse JSON: %s", str(e))
-            logger.error("JSON string: %s", json_str[:500])
-            raise
\ No newline at end of file
+                if isinstance(parsed, dict):
+                    return parsed
+            start = response_text.find("{", end)
+
+        if first_error is None:
+            logger.error("Could not find JSON in response: %s", response_text[:200])
+            raise ValueError("No JSON found in response")
+
+        e, json_str = first_error
+        logger.error("Failed to parse JSON: %s", str(e))
+        logger.error("JSON string: %s", json_str[:500])
+        raise e
@@ -2,9 +2,10 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Configuration
 INPUT_DIRECTORY = "countries_html"
@@ -13,17 +14,24 @@ OUTPUT_DATABASE = "plonkit_database.json"
 # Logging Setup
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Joins a section's item texts so links are cleaned in one pass per section; links
+# can't span it, so each item is cleaned exactly as on its own
+_ITEM_SEPARATOR = "\x1e"
+
+# Regex to clean Markdown links: [Text](url) -> Text
+_LINK_RE = re.compile(r"\[([^\]\x1e]+)\]\([^)\x1e]+\)")
+
 
 class CountryParser:
     def __init__(self):
-        # Regex to clean Markdown links: [Text](url) -> Text
-        self.link_pattern = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+        # Only the preloaded data script is needed, so no tree is built for the rest
+        self.data_strainer = SoupStrainer("script", id="__PRELOADED_DATA__")
 
     def parse_html(self, html_content: str) -> dict[str, Any] | None:
         """
         Extracts preloaded JSON data from the Plonkit HTML structure.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "html.parser", parse_only=self.data_strainer)
         script_tag = soup.find("script", id="__PRELOADED_DATA__")
 
         if not script_tag:
@@ -53,7 +61,7 @@ class CountryParser:
         steps = public_data.get("steps", [])
         for step in steps:
             section_title = step.get("title", "Information")
-            section_lines = []
+            item_texts = []
 
             items = step.get("items", [])
             for item in items:
@@ -66,9 +74,14 @@ class CountryParser:
                 )
 
                 if full_text:
-                    cleaned_text = self.link_pattern.sub(r"\1", full_text).strip()
-                    if cleaned_text:
-                        section_lines.append(f"- {cleaned_text}")
+                    item_texts.append(full_text)
+
+            cleaned_texts = _LINK_RE.sub(r"\1", _ITEM_SEPARATOR.join(item_texts))
+            section_lines = [
+                f"- {cleaned_text.strip()}"
+                for cleaned_text in cleaned_texts.split(_ITEM_SEPARATOR)
+                if cleaned_text.strip()
+            ]
 
             if section_lines:
                 parsed_entry["sections"].append(
@@ -78,34 +91,47 @@ class CountryParser:
         return parsed_entry
 
 
+_parser = CountryParser()
+
+
+def _parse_one(file_path: str) -> dict[str, Any] | None:
+    """Read and parse one HTML file; module-level so worker processes can run it."""
+    with open(file_path, encoding="utf-8") as f:
+        content = f.read()
+
+    return _parser.parse_html(content)
+
+
 def process_files():
     if not os.path.exists(INPUT_DIRECTORY):
         logging.error(f"Directory '{INPUT_DIRECTORY}' not found.")
         return
 
-    parser = CountryParser()
     files = [f for f in os.listdir(INPUT_DIRECTORY) if f.endswith(".html")]
     all_results = []
 
     logging.info(f"Initiating batch processing for {len(files)} files...")
 
-    for filename in files:
-        file_path = os.path.join(INPUT_DIRECTORY, filename)
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            data = parser.parse_html(content)
-
-            if data:
-                all_results.append(data)
-                logging.info(f"Processed: {filename}")
-            else:
-                logging.warning(f"No valid data extracted from: {filename}")
-
-        except Exception as e:
-            logging.error(f"Error processing {filename}: {str(e)}")
+    # Parsing is CPU-bound and files are independent, so spread them over processes;
+    # results are collected in file order so the output doesn't depend on scheduling
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            (filename, executor.submit(_parse_one, os.path.join(INPUT_DIRECTORY, filename)))
+            for filename in files
+        ]
+
+        for filename, future in futures:
+            try:
+                data = future.result()
+
+                if data:
+                    all_results.append(data)
+                    logging.info(f"Processed: {filename}")
+                else:
+                    logging.warning(f"No valid data extracted from: {filename}")
+
+            except Exception as e:
+                logging.error(f"Error processing {filename}: {str(e)}")
 
     # Save to Master Database
     with open(OUTPUT_DATABASE, "w", encoding="utf-8") as f:
@@ -1,11 +1,11 @@
+import asyncio
 import json
 import logging
 import os
 import random
-import time
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import BrowserContext, async_playwright
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
@@ -13,15 +13,65 @@ APP_DIR = SCRIPT_DIR.parent
 INPUT_FILE = str(APP_DIR / "data" / "countries.json")
 OUTPUT_DIRECTORY = "countries_html"
 BASE_URL = "https://www.plonkit.net/"
+# Pages fetched at once, each in its own browser context
+CONCURRENCY = 5
 
 # Logging Configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
-def download_country_data():
+def _write_html(file_path: str, html_content: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+
+async def _download_worker(
+    context: BrowserContext, queue: asyncio.Queue[tuple[int, str]], total_count: int
+) -> None:
+    """Fetch queued countries one at a time with a single page."""
+    page = await context.new_page()
+
+    while True:
+        try:
+            index, slug = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        file_path = os.path.join(OUTPUT_DIRECTORY, f"{slug}.html")
+
+        # Check for existing data to support process resumption
+        if os.path.exists(file_path):
+            logging.info(f"[{index}/{total_count}] Skipping: '{slug}' (Resource already exists)")
+            continue
+
+        target_url = f"{BASE_URL}{slug}"
+        logging.info(f"[{index}/{total_count}] Requesting: {target_url}")
+
+        try:
+            await page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
+
+            # Buffer for Cloudflare challenge resolution and dynamic JS rendering
+            await asyncio.sleep(random.uniform(5.0, 8.0))
+
+            html_content = await page.content()
+            await asyncio.to_thread(_write_html, file_path, html_content)
+
+            logging.info(f"Successfully archived: {slug}")
+
+        except Exception as e:
+            logging.error(f"Failed to retrieve {slug}: {str(e)}")
+
+        # Rate limiting to prevent IP blacklisting
+        await asyncio.sleep(random.uniform(2.0, 4.0))
+
+
+async def download_country_data():
     """
     Automates the retrieval of country-specific HTML content using Playwright.
     Includes anti-bot measures and persistence checks.
+
+    Up to CONCURRENCY pages are in flight at once, so the waits for page loads and
+    challenge resolution overlap instead of adding up.
     """
 
     # 1. Resource Validation
@@ -44,56 +94,33 @@ def download_country_data():
     total_count = len(countries)
     logging.info(f"Queue initialized: {total_count} entries identified.")
 
-    with sync_playwright() as p:
+    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+    for index, slug in enumerate(countries, start=1):
+        queue.put_nowait((index, slug))
+
+    async with async_playwright() as p:
         logging.info("Initializing Chromium instance...")
 
         # Headless=False is maintained to bypass advanced bot detection (e.g., Cloudflare)
-        browser = p.chromium.launch(headless=False)
+        browser = await p.chromium.launch(headless=False)
 
         # User Agent rotation or static professional header
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) \
+        contexts = [
+            await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) \
 AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        )
-
-        page = context.new_page()
-
-        for index, slug in enumerate(countries, start=1):
-            file_path = os.path.join(OUTPUT_DIRECTORY, f"{slug}.html")
-
-            # Check for existing data to support process resumption
-            if os.path.exists(file_path):
-                logging.info(
-                    f"[{index}/{total_count}] Skipping: '{slug}' (Resource already exists)"
-                )
-                continue
-
-            target_url = f"{BASE_URL}{slug}"
-            logging.info(f"[{index}/{total_count}] Requesting: {target_url}")
+            )
+            for _ in range(CONCURRENCY)
+        ]
 
-            try:
-                page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
-
-                # Buffer for Cloudflare challenge resolution and dynamic JS rendering
-                time.sleep(random.uniform(5.0, 8.0))
-
-                html_content = page.content()
-
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-
-                logging.info(f"Successfully archived: {slug}")
-
-            except Exception as e:
-                logging.error(f"Failed to retrieve {slug}: {str(e)}")
-
-            # Rate limiting to prevent IP blacklisting
-            time.sleep(random.uniform(2.0, 4.0))
+        await asyncio.gather(
+            *(_download_worker(context, queue, total_count) for context in contexts)
+        )
 
         logging.info("Data acquisition complete. Closing browser.")
-        browser.close()
+        await browser.close()
 
 
 if __name__ == "__main__":
-    download_country_data()
+    asyncio.run(download_country_data())
@@ -0,0 +1,38 @@
+"""Shared HTTP sessions with connection pooling and retries."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Nominatim and other public APIs require an identifying User-Agent
+USER_AGENT = "O-Agent-GeoDetective/1.0"
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+def create_http_session(pool_maxsize: int = 20) -> requests.Session:
+    """Create a session that keeps connections alive between requests.
+
+    Transient failures (connection errors, 429 and 5xx responses) are retried
+    with exponential backoff.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host.
+
+    Returns:
+        Session to be shared by all calls of one tool.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
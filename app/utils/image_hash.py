@@ -0,0 +1,49 @@
+"""Perceptual hashing for recognizing near-duplicate images."""
+
+import hashlib
+
+from PIL import Image
+
+HASH_SIZE = 8
+
+
+def dhash(img: Image.Image, hash_size: int = HASH_SIZE) -> int:
+    """Compute the difference hash of an image.
+
+    The image is reduced to a (hash_size + 1) x hash_size grayscale grid and each
+    bit records whether a pixel is brighter than its right neighbour, so re-encoding,
+    resizing and small edits leave most bits unchanged.
+
+    Args:
+        img: Image to hash.
+        hash_size: Bits per row and number of rows (64-bit hash by default).
+
+    Returns:
+        Hash as a non-negative integer of hash_size**2 bits.
+    """
+    small = img.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+    pixels = small.tobytes()
+    width = hash_size + 1
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * width
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def pixel_digest(img: Image.Image) -> str:
+    """Exact hash of an image's decoded pixels (mode, size and data).
+
+    Unlike a hash of the file, it is unchanged by container differences such as
+    stripped or edited metadata; unlike dhash, any pixel change alters it.
+    """
+    digest = hashlib.sha256(f"{img.mode}:{img.width}x{img.height}:".encode())
+    digest.update(img.tobytes())
+    return digest.hexdigest()
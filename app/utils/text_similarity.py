@@ -0,0 +1,38 @@
+"""Lightweight lexical similarity between texts, computed locally."""
+
+import math
+import re
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"\w{3,}")
+
+# Sparse unit-length term vector: token -> weight
+TextVector = dict[str, float]
+
+
+def text_vector(text: str) -> TextVector:
+    """Build an L2-normalized bag-of-words vector for text.
+
+    Args:
+        text: Text to vectorize. Tokens shorter than three characters are ignored.
+
+    Returns:
+        Mapping of lowercased token to weight, or an empty dict if text has no tokens.
+    """
+    counts = Counter(_TOKEN_RE.findall(text.lower()))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    if not norm:
+        return {}
+    return {token: count / norm for token, count in counts.items()}
+
+
+def cosine_similarity(a: TextVector, b: TextVector) -> float:
+    """Cosine similarity of two vectors produced by text_vector, in [0, 1]."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b[token] for token, weight in a.items() if token in b)
+
+
+def max_cosine_similarity(vector: TextVector, others: list[TextVector]) -> float:
+    """Highest cosine similarity between vector and any of others (0.0 if none)."""
+    return max((cosine_similarity(vector, other) for other in others), default=0.0)
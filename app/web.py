@@ -1,10 +1,13 @@
 """Minimalist web interface for o-agent investigations."""
 
 import asyncio
-import json
+import functools
+import shutil
+import time
 import uuid
 from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import FastAPI, File, Form, UploadFile
 from fastapi.responses import HTMLResponse, StreamingResponse
@@ -13,8 +16,42 @@ from app.investigation_runner import InvestigationRunner
 
 app = FastAPI(title="o-agent Web Interface")
 
-# Store active investigations
+# Store active investigations. A run is removed when its progress stream ends;
+# runs whose progress is never requested are dropped after UNCLAIMED_TTL_S, or
+# oldest first beyond MAX_UNCLAIMED. Runs that are streaming are never evicted.
+UNCLAIMED_TTL_S = 3600
+MAX_UNCLAIMED = 64
 active_investigations: dict[str, InvestigationRunner] = {}
+# Creation time of investigations whose progress has not been requested yet
+_unclaimed_since: dict[str, float] = {}
+
+UPLOAD_DIR = Path("app/images/uploads")
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@functools.cache
+def _upload_dir() -> Path:
+    """Return the upload directory, creating it on first use only."""
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    return UPLOAD_DIR
+
+
+def _evict_unclaimed() -> None:
+    """Forget unclaimed investigations that are expired, then make room for a new one.
+
+    _unclaimed_since is in creation order, so the oldest unclaimed runs go first.
+    """
+    cutoff = time.monotonic() - UNCLAIMED_TTL_S
+    for investigation_id, created_at in list(_unclaimed_since.items()):
+        if created_at < cutoff or len(_unclaimed_since) >= MAX_UNCLAIMED:
+            del _unclaimed_since[investigation_id]
+            active_investigations.pop(investigation_id, None)
+
+
+def _save_upload(source: BinaryIO, file_path: Path) -> None:
+    """Copy an uploaded file to disk in fixed-size chunks."""
+    with open(file_path, "wb") as f:
+        shutil.copyfileobj(source, f, UPLOAD_CHUNK_SIZE)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -41,18 +78,17 @@ async def start_investigation(
     # Generate unique investigation ID
     investigation_id = str(uuid.uuid4())
 
-    # Save uploaded file temporarily
-    upload_dir = Path("app/images/uploads")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    file_path = upload_dir / f"{investigation_id}_{file.filename}"
-
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+    # Save uploaded file temporarily; the copy runs in a thread so other
+    # requests aren't blocked on disk I/O, and streams so the image is never
+    # held in memory in full
+    file_path = _upload_dir() / f"{investigation_id}_{file.filename}"
+    await asyncio.to_thread(_save_upload, file.file, file_path)
 
     # Create investigation runner with selected mode
-    runner = InvestigationRunner(str(file_path), mode=mode)
+    runner = await InvestigationRunner.create(str(file_path), mode=mode)
+    _evict_unclaimed()
     active_investigations[investigation_id] = runner
+    _unclaimed_since[investigation_id] = time.monotonic()
 
     return {"investigation_id": investigation_id, "status": "started", "mode": mode}
 
@@ -68,24 +104,26 @@ async def stream_progress(investigation_id: str):
     Returns:
         SSE stream of progress updates
     """
-    if investigation_id not in active_investigations:
+    runner = active_investigations.get(investigation_id)
+    if runner is None:
         return {"error": "Investigation not found"}
-
-    runner = active_investigations[investigation_id]
+    _unclaimed_since.pop(investigation_id, None)
 
     async def event_generator() -> AsyncIterator[str]:
         """Generate SSE events from investigation progress."""
         # Start investigation in background
-        asyncio.create_task(runner.run())
-
-        # Stream progress updates
-        async for update in runner.progress_stream():
-            # Format as SSE
-            data = json.dumps(update.model_dump())
-            yield f"data: {data}\n\n"
-
-        # Cleanup after completion
-        del active_investigations[investigation_id]
+        task = asyncio.create_task(runner.run())
+
+        try:
+            # Stream progress updates
+            async for update in runner.progress_stream():
+                yield update.sse_event
+        finally:
+            # Cleanup after completion, or stop the run if the client disconnected
+            if not task.done():
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            active_investigations.pop(investigation_id, None)
 
     return StreamingResponse(
         event_generator(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
@@ -0,0 +1,73 @@
+import pytest
+
+from app.utils import cache
+from app.utils.cache import DiskCacheBackend, MemoryCacheBackend
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+def test_memory_entries_expire_after_ttl(clock):
+    backend = MemoryCacheBackend(ttl=60)
+    backend.set("default", 1)
+    backend.set("override", 2, ttl=300)
+
+    clock.now += 61
+    assert backend.get("default") is None
+    assert backend.get("override") == 2
+
+    clock.now += 300
+    assert backend.get("override") is None
+
+
+def test_memory_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")  # "b" is now the least recently used
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+    assert len(backend) == 2
+
+
+def test_disk_round_trip_survives_new_instance(tmp_path):
+    value = {"text": "Ulica Długa", "scores": [0.5, 1], "nested": {"ok": True}}
+    DiskCacheBackend(tmp_path).set("key", value)
+
+    assert DiskCacheBackend(tmp_path).get("key") == value
+    assert DiskCacheBackend(tmp_path).get("missing") is None
+
+
+def test_disk_entries_expire_after_ttl(tmp_path, clock):
+    backend = DiskCacheBackend(tmp_path, ttl=60)
+    backend.set("key", "value")
+
+    clock.now += 59
+    assert backend.get("key") == "value"
+
+    clock.now += 2
+    assert backend.get("key") is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_disk_drops_unreadable_entries(tmp_path):
+    backend = DiskCacheBackend(tmp_path)
+    (tmp_path / "key.json").write_text("{not json")
+
+    assert backend.get("key") is None
+    assert not (tmp_path / "key.json").exists()
@@ -0,0 +1,87 @@
+from typing import Any
+
+from app.tools.base_tool import BaseTool, ToolResult
+from app.tools.cached_tool import CachedTool
+from app.utils.cache import MemoryCacheBackend
+
+
+class EchoTool(BaseTool):
+    name = "echo"
+    description = "Returns its arguments"
+    parameters: dict[str, Any] = {"type": "object", "properties": {}}
+
+    def __init__(self, success: bool = True):
+        self.success = success
+        self.calls: list[dict[str, Any]] = []
+
+    def execute(self, **kwargs) -> ToolResult:
+        self.calls.append(kwargs)
+        if not self.success:
+            return ToolResult(success=False, error="unavailable")
+        return ToolResult(success=True, data=dict(kwargs), metadata={"call": len(self.calls)})
+
+
+def test_exact_arguments_hit_the_cache():
+    inner = EchoTool()
+    tool = CachedTool(inner, MemoryCacheBackend())
+
+    first = tool.execute(query="oslo tram", max_results=5)
+    second = tool.execute(max_results=5, query="oslo tram")
+
+    assert second == first
+    assert len(inner.calls) == 1
+    assert (tool.hits, tool.misses) == (1, 1)
+
+
+def test_different_arguments_miss_the_cache():
+    inner = EchoTool()
+    tool = CachedTool(inner, MemoryCacheBackend())
+
+    tool.execute(query="oslo tram", max_results=5)
+    tool.execute(query="oslo tram", max_results=10)
+
+    assert len(inner.calls) == 2
+    assert (tool.hits, tool.misses) == (0, 2)
+
+
+def test_failed_results_are_not_cached():
+    inner = EchoTool(success=False)
+    tool = CachedTool(inner, MemoryCacheBackend())
+
+    tool.execute(query="oslo tram")
+    tool.execute(query="oslo tram")
+
+    assert len(inner.calls) == 2
+
+
+def test_fuzzy_hit_on_nearly_identical_query():
+    inner = EchoTool()
+    tool = CachedTool(inner, MemoryCacheBackend(), fuzzy_arg="query")
+
+    tool.execute(query="yellow license plate norway", max_results=5)
+    result = tool.execute(query="yellow licence plate norway", max_results=5)
+
+    assert len(inner.calls) == 1
+    assert tool.fuzzy_hits == 1
+    assert result.data["query"] == "yellow license plate norway"
+    assert result.metadata["fuzzy_match_of"] == "yellow license plate norway"
+
+
+def test_fuzzy_miss_on_different_query_or_other_arguments():
+    inner = EchoTool()
+    tool = CachedTool(inner, MemoryCacheBackend(), fuzzy_arg="query")
+
+    tool.execute(query="yellow license plate norway", max_results=5)
+    tool.execute(query="red phone booth london", max_results=5)
+    tool.execute(query="yellow licence plate norway", max_results=10)
+
+    assert len(inner.calls) == 3
+    assert tool.fuzzy_hits == 0
+
+
+def test_cached_metadata_is_not_shared_with_callers():
+    tool = CachedTool(EchoTool(), MemoryCacheBackend())
+
+    tool.execute(query="oslo tram").metadata["note"] = "added by caller"
+
+    assert "note" not in tool.execute(query="oslo tram").metadata
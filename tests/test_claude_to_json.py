@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from app.utils.claude_to_json import _find_json_span, extract_json_from_response
+
+
+def test_find_json_span_on_nested_objects():
+    text = 'Plan: {"a": {"b": {"c": 1}}, "d": 2} trailing {"e": 3}'
+    start = text.index("{")
+
+    end = _find_json_span(text, start)
+
+    assert text[start:end] == '{"a": {"b": {"c": 1}}, "d": 2}'
+
+
+def test_find_json_span_ignores_braces_inside_strings():
+    text = '{"pattern": "} not the end {", "escaped": "quote \\" and } brace"}'
+
+    assert _find_json_span(text, 0) == len(text)
+
+
+def test_find_json_span_handles_escaped_backslash_before_quote():
+    # The string ends at the quote after the escaped backslash, so the next } closes
+    text = '{"path": "C:\\\\"} extra }'
+
+    assert _find_json_span(text, 0) == text.index("}") + 1
+
+
+def test_find_json_span_unclosed_block():
+    assert _find_json_span('{"a": {"b": 1}', 0) == -1
+
+
+def test_extract_skips_prose_braces_and_fenced_code():
+    response = (
+        "Using the {template} from before, here is the plan:\n"
+        "```json\n"
+        '{"state": "Sign reads \\"Bryggen {old town}\\"", "next_steps": [{"step": 1}]}\n'
+        "```\n"
+        'Ignore {"other": true}'
+    )
+
+    assert extract_json_from_response(response) == {
+        "state": 'Sign reads "Bryggen {old town}"',
+        "next_steps": [{"step": 1}],
+    }
+
+
+def test_extract_raises_when_no_json_object():
+    with pytest.raises(ValueError):
+        extract_json_from_response("No structured answer here.")
+
+    with pytest.raises(json.JSONDecodeError):
+        extract_json_from_response("{not: valid}")
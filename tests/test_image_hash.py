@@ -0,0 +1,36 @@
+from PIL import Image
+
+from app.utils.image_hash import dhash, hamming_distance, pixel_digest
+
+
+def test_dhash_on_known_gradients():
+    # Brightness falls left to right, so every pixel is brighter than its neighbour
+    falling = Image.linear_gradient("L").transpose(Image.Transpose.ROTATE_270).resize((90, 80))
+    rising = falling.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+
+    assert dhash(falling) == 2**64 - 1
+    assert dhash(rising) == 0
+    assert dhash(Image.new("RGB", (50, 50), (120, 30, 200))) == 0
+
+
+def test_dhash_is_stable_under_resizing():
+    img = Image.effect_mandelbrot((640, 480), (-2.0, -1.5, 1.0, 1.5), 50)
+
+    assert hamming_distance(dhash(img), dhash(img.resize((320, 240)))) <= 2
+    assert hamming_distance(dhash(img), dhash(img.transpose(Image.Transpose.FLIP_LEFT_RIGHT))) > 10
+
+
+def test_hamming_distance():
+    assert hamming_distance(0b1011, 0b1011) == 0
+    assert hamming_distance(0b1011, 0b0010) == 2
+    assert hamming_distance(0, 2**64 - 1) == 64
+
+
+def test_pixel_digest_changes_with_any_pixel():
+    img = Image.effect_mandelbrot((64, 48), (-2.0, -1.5, 1.0, 1.5), 50).convert("RGB")
+    edited = img.copy()
+    edited.putpixel((10, 10), (0, 0, 0) if img.getpixel((10, 10)) != (0, 0, 0) else (1, 1, 1))
+
+    assert pixel_digest(img) == pixel_digest(img.copy())
+    assert pixel_digest(img) != pixel_digest(edited)
+    assert pixel_digest(img) != pixel_digest(img.convert("L"))
@@ -0,0 +1,83 @@
+import pytest
+from PIL import Image, ImageDraw, PngImagePlugin
+
+import app.tools.image_to_text.image_to_text as i2t
+from app.tools.image_to_text import preprocessing
+from app.utils.cache import MemoryCacheBackend
+from app.utils.image_hash import dhash, hamming_distance, pixel_digest
+
+
+def _street_scene() -> Image.Image:
+    img = Image.new("RGB", (1600, 1200))
+    draw = ImageDraw.Draw(img)
+    for y in range(1200):
+        draw.line([(0, y), (1600, y)], fill=(90 + y // 10, 120, 200 - y // 8))
+    draw.rectangle([200, 500, 700, 1100], fill=(150, 80, 60))
+    draw.rectangle([900, 400, 1400, 1100], fill=(60, 60, 70))
+    return img
+
+
+def _cache_inputs(path):
+    with open(path, "rb") as f:
+        image_bytes = f.read()
+    _, _, img = preprocessing.preprocess_image(path, image_bytes=image_bytes)
+    return i2t._features_cache_key(image_bytes), dhash(img), pixel_digest(img)
+
+
+def test_similar_but_distinct_images_do_not_share_features(tmp_path, monkeypatch):
+    backend = MemoryCacheBackend()
+    monkeypatch.setattr(i2t, "_get_features_cache", lambda: backend)
+
+    original = _street_scene()
+    original.save(tmp_path / "a.png")
+
+    # Same street, different shop sign
+    variant = original.copy()
+    ImageDraw.Draw(variant).rectangle([950, 450, 1150, 520], fill=(240, 240, 30))
+    variant.save(tmp_path / "b.png")
+
+    key_a, hash_a, digest_a = _cache_inputs(tmp_path / "a.png")
+    key_b, hash_b, digest_b = _cache_inputs(tmp_path / "b.png")
+    assert hamming_distance(hash_a, hash_b) <= i2t.PERCEPTUAL_MATCH_MAX_DISTANCE
+
+    i2t._cache_features(key_a, hash_a, digest_a, {"textual_features": "SHOP A"})
+    assert i2t._get_cached_features(key_b, hash_b, digest_b) is None
+
+
+def test_identical_pixels_in_a_different_file_reuse_features(tmp_path, monkeypatch):
+    backend = MemoryCacheBackend()
+    monkeypatch.setattr(i2t, "_get_features_cache", lambda: backend)
+
+    original = _street_scene()
+    original.save(tmp_path / "a.png")
+    info = PngImagePlugin.PngInfo()
+    info.add_text("Comment", "re-saved with different metadata")
+    original.save(tmp_path / "b.png", pnginfo=info)
+
+    key_a, hash_a, digest_a = _cache_inputs(tmp_path / "a.png")
+    key_b, hash_b, digest_b = _cache_inputs(tmp_path / "b.png")
+    assert key_a != key_b
+
+    features = {"textual_features": "SHOP A"}
+    i2t._cache_features(key_a, hash_a, digest_a, features)
+    assert i2t._get_cached_features(key_b, hash_b, digest_b) == features
+
+
+@pytest.mark.parametrize(
+    ("setting", "value"),
+    [
+        ("vision_combined_pass", True),
+        ("vision_text_model", "claude-sonnet-4-5"),
+        ("vision_env_model", "claude-sonnet-4-5"),
+    ],
+)
+def test_changing_vision_settings_invalidates_cached_features(monkeypatch, setting, value):
+    monkeypatch.setattr(i2t.settings, "vision_combined_pass", False)
+    image_bytes = b"same file"
+    key = i2t._features_cache_key(image_bytes)
+    index_key = i2t._perceptual_index_key()
+
+    monkeypatch.setattr(i2t.settings, setting, value)
+
+    assert i2t._features_cache_key(image_bytes) != key
+    assert i2t._perceptual_index_key() != index_key
@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+from anthropic.types import Message
+
+from app.llm_cache import CachingAnthropicClient
+from app.utils.cache import MemoryCacheBackend
+
+
+class FakeMessages:
+    def __init__(self):
+        self.calls: list[dict[str, Any]] = []
+
+    def create(self, **kwargs: Any) -> Message:
+        self.calls.append(kwargs)
+        return Message.model_validate(
+            {
+                "id": f"msg_{len(self.calls)}",
+                "type": "message",
+                "role": "assistant",
+                "model": kwargs["model"],
+                "content": [{"type": "text", "text": f"reply {len(self.calls)}"}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 2},
+            }
+        )
+
+
+class FakeClient:
+    def __init__(self):
+        self.messages = FakeMessages()
+
+
+def _request(**overrides: Any) -> dict[str, Any]:
+    return {
+        "model": "claude-test",
+        "max_tokens": 100,
+        "system": "Be brief.",
+        "messages": [{"role": "user", "content": "Where is this?"}],
+        **overrides,
+    }
+
+
+def test_temperature_zero_requests_are_cached():
+    inner = FakeClient()
+    client = CachingAnthropicClient(inner, MemoryCacheBackend())
+
+    first = client.messages.create(**_request(temperature=0))
+    second = client.messages.create(**_request(temperature=0))
+
+    assert second == first
+    assert second.content[0].text == "reply 1"
+    assert len(inner.messages.calls) == 1
+    assert (client.hits, client.misses) == (1, 1)
+
+
+def test_changed_request_misses_the_cache():
+    inner = FakeClient()
+    client = CachingAnthropicClient(inner, MemoryCacheBackend())
+
+    client.messages.create(**_request(temperature=0))
+    client.messages.create(**_request(temperature=0, system="Be thorough."))
+
+    assert len(inner.messages.calls) == 2
+
+
+@pytest.mark.parametrize("overrides", [{}, {"temperature": 0.7}, {"temperature": 1}])
+def test_non_zero_temperature_bypasses_the_cache(overrides):
+    inner = FakeClient()
+    backend = MemoryCacheBackend()
+    client = CachingAnthropicClient(inner, backend)
+
+    first = client.messages.create(**_request(**overrides))
+    second = client.messages.create(**_request(**overrides))
+
+    assert first.content[0].text != second.content[0].text
+    assert len(inner.messages.calls) == 2
+    assert len(backend) == 0
+    assert (client.hits, client.misses) == (0, 0)
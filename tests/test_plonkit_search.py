@@ -0,0 +1,31 @@
+import json
+
+from app.tools.plonkit_search.plonkit_search import PlonkitSearchTool
+
+DATABASE = [
+    {
+        "country": "Norway",
+        "code": "NO",
+        "sections": [
+            {"title": "Bollards", "description": "Bollards have a yellow reflector."},
+            {"title": "Signs", "description": "Road signs are YELLOW."},
+        ],
+    },
+]
+
+
+def test_matched_keywords_keep_caller_spelling_and_order(tmp_path):
+    db_path = tmp_path / "plonkit.json"
+    db_path.write_text(json.dumps(DATABASE))
+    tool = PlonkitSearchTool(db_path=str(db_path))
+
+    # Warm the cache with a different spelling of the same keywords
+    tool.execute(keywords=["bollard", "yellow"])
+    result = tool.execute(keywords=["Yellow", "Cyrillic", "Bollard"])
+
+    (country,) = result.data["results"]
+    assert country["matched_keywords"] == ["Yellow", "Bollard"]
+    assert [s["matched_keywords"] for s in country["sections"]] == [
+        ["Yellow", "Bollard"],
+        ["Yellow"],
+    ]
@@ -0,0 +1,61 @@
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageEnhance
+
+from app.tools.image_to_text.preprocessing import (
+    TARGET_LONGEST_SIDE,
+    adjust_contrast,
+    open_heif_preview,
+    preprocess_image,
+)
+
+
+def _sample_image(size: tuple[int, int] = (640, 480)) -> Image.Image:
+    width, height = size
+    img = Image.new("RGB", size)
+    draw = ImageDraw.Draw(img)
+    for y in range(height):
+        draw.line([(0, y), (width, y)], fill=(y // 2 % 256, 255 - y // 2 % 256, (y * 3) % 256))
+    draw.rectangle([100, 100, 300, 400], fill=(230, 40, 40))
+    draw.ellipse([350, 50, 600, 300], fill=(20, 200, 90))
+    return img
+
+
+@pytest.mark.parametrize("factor", [0.8, 1.1, 1.5])
+def test_adjust_contrast_matches_image_enhance(factor):
+    img = _sample_image()
+
+    ours = adjust_contrast(img, factor)
+    expected = ImageEnhance.Contrast(img).enhance(factor)
+
+    max_diff = max(high for _, high in ImageChops.difference(ours, expected).getextrema())
+    assert max_diff <= 1
+
+
+def _save_heic(path, thumbnails: list[int]) -> None:
+    img = _sample_image((1600, 1200))
+    # pillow_heif encodes a downscaled thumbnail for each listed box size
+    img.info["thumbnails"] = thumbnails
+    img.save(path, format="HEIF", quality=50)
+
+
+def test_open_heif_preview_picks_smallest_thumbnail_covering_target(tmp_path):
+    path = tmp_path / "photo.heic"
+    _save_heic(path, [256, 1100, 1400])
+
+    preview = open_heif_preview(path)
+
+    assert preview is not None
+    assert max(preview.size) == 1100
+
+
+def test_open_heif_preview_without_large_thumbnail_falls_back_to_full_decode(tmp_path):
+    small_thumb = tmp_path / "small_thumb.heic"
+    no_thumb = tmp_path / "no_thumb.heic"
+    _save_heic(small_thumb, [256])
+    _save_heic(no_thumb, [])
+
+    assert open_heif_preview(small_thumb) is None
+    assert open_heif_preview(no_thumb) is None
+
+    _, _, img = preprocess_image(str(no_thumb))
+    assert max(img.size) == TARGET_LONGEST_SIDE
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.investigation_runner import ProgressUpdate
+
+
+def _update() -> ProgressUpdate:
+    return ProgressUpdate(
+        phase="summarizing",
+        message="Summary generated",
+        current_lead="Currently considering Bergen, Norway",
+        details={"key_points": 3, "is_redundant": False, "note": "Ø and “quotes”"},
+        terminal_output="[SUMMARIZE] ✓ Found 3 key points",
+    )
+
+
+def test_sse_event_matches_serializing_on_every_send():
+    update = _update()
+
+    assert update.sse_event == f"data: {update.model_dump_json()}\n\n"
+    # Same payload the stream used to build with json.dumps(update.model_dump())
+    payload = update.sse_event.removeprefix("data: ").removesuffix("\n\n")
+    assert json.loads(payload) == json.loads(json.dumps(update.model_dump()))
+
+
+def test_sse_event_is_serialized_once():
+    update = _update()
+
+    assert update.sse_event is update.sse_event
+
+
+def test_updates_are_frozen():
+    update = _update()
+
+    with pytest.raises(ValidationError):
+        update.message = "changed"
+    assert update.message == "Summary generated"
@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+from app.utils.text_similarity import cosine_similarity, max_cosine_similarity, text_vector
+
+
+def test_text_vector_is_normalized_and_ignores_short_tokens():
+    vector = text_vector("Tram tram to Oslo")
+
+    assert set(vector) == {"tram", "oslo"}
+    assert vector["tram"] == pytest.approx(2 / math.sqrt(5))
+    assert math.fsum(weight * weight for weight in vector.values()) == pytest.approx(1.0)
+    assert text_vector("a b c") == {}
+
+
+def test_cosine_similarity_on_known_inputs():
+    tram = text_vector("yellow tram oslo")
+
+    assert cosine_similarity(tram, text_vector("Oslo TRAM yellow")) == pytest.approx(1.0)
+    assert cosine_similarity(tram, text_vector("red phone booth")) == 0.0
+    # Two of three tokens shared, each vector with three unit-weight tokens
+    assert cosine_similarity(tram, text_vector("yellow tram bergen")) == pytest.approx(2 / 3)
+    assert cosine_similarity(tram, {}) == 0.0
+
+
+def test_max_cosine_similarity_picks_the_closest():
+    tram = text_vector("yellow tram oslo")
+    others = [text_vector("red phone booth"), text_vector("yellow tram bergen")]
+
+    assert max_cosine_similarity(tram, others) == pytest.approx(2 / 3)
+    assert max_cosine_similarity(tram, []) == 0.0